@@ -5,13 +5,28 @@ Provides both web interface and REST API for sentiment analysis.
 """
 
 import os
-import json
+import atexit
 import logging
+import dataclasses
+import functools
+import hashlib
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from flask import Flask, request, jsonify, render_template, flash, redirect, url_for
+from flask import Flask, Response, request, jsonify, render_template, stream_template, flash, redirect, url_for
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+import orjson
 import sqlite3
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+# Split CPU threads between server worker processes before any model loads
+WEB_WORKERS = max(1, int(os.getenv('WEB_CONCURRENCY', '1')))
+INFERENCE_THREADS = max(1, (os.cpu_count() or 1) // WEB_WORKERS)
+os.environ.setdefault('OMP_NUM_THREADS', str(INFERENCE_THREADS))
 
 # Import feelnet modules
 import sys
@@ -33,25 +48,166 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson for faster (de)serialization."""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS),
+            mimetype=self.mimetype
+        )
+
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.secret_key = os.getenv('SECRET_KEY', 'feelnet-secret-key-change-in-production')
 CORS(app)
 
 # Initialize feelnet components
 analyzer = SentimentAnalyzer(method="ensemble")
+
+
+def warm_up_analyzer(target: SentimentAnalyzer):
+    """Run a few short texts through an analyzer so the first request is not cold."""
+    try:
+        import torch
+        torch.set_num_threads(INFERENCE_THREADS)
+    except ImportError:
+        pass
+    
+    for text in ("warmup", "This is great!", "This is terrible."):
+        try:
+            target.analyze(text)
+        except Exception as e:
+            logger.warning(f"Analyzer warmup failed: {e}")
+            break
+
+
+warm_up_analyzer(analyzer)
+
+# Shared analyzers per method, built lazily on first use
+ANALYSIS_METHODS = ('vader', 'textblob', 'transformer', 'ensemble', 'hybrid')
+ANALYZERS: Dict[str, SentimentAnalyzer] = {'ensemble': analyzer}
+_analyzers_lock = threading.Lock()
+
 scraper_factory = ScraperFactory()
 preprocessor = TextPreprocessor()
 
+# Longer inputs are rejected before analysis
+MAX_TEXT_LENGTH = int(os.getenv('MAX_TEXT_LENGTH', '10000'))
+
+# Platform metadata is static per process, so clients may cache it
+PLATFORMS_MAX_AGE = 300
+
+# History listing pagination
+HISTORY_PAGE_SIZE = 100
+HISTORY_MAX_PAGE_SIZE = 500
+
+# Scraped reviews are analyzed in chunks on a shared worker pool
+ANALYSIS_CHUNK_SIZE = 32
+ANALYSIS_WORKERS = 4
+analysis_executor = ThreadPoolExecutor(max_workers=ANALYSIS_WORKERS, thread_name_prefix='feelnet-analysis')
+
 # Database setup
 DATABASE = 'data/feelnet.db'
 
+# Kept as a single constant so pooled connections reuse the prepared statement
+INSERT_ANALYSIS_SQL = '''
+    INSERT INTO analysis_history 
+    (text, sentiment, confidence, scores, method, processing_time, source_url, platform)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Per-connection tuning applied to every pooled connection
+SQLITE_PRAGMAS = (
+    'synchronous=NORMAL',
+    'temp_store=MEMORY',
+    'mmap_size=268435456',
+    'cache_size=-20000',
+    'busy_timeout=5000',
+)
+
+
+class SqlitePool:
+    """
+    Fixed-size pool of reusable SQLite connections.
+    
+    Connections are opened lazily on first checkout and kept open for the
+    lifetime of the process, so requests no longer pay for opening the
+    database file and warming its page cache on every call.
+    """
+    
+    def __init__(self, database: str, size: int = 1, readonly: bool = False):
+        """
+        Initialize connection pool.
+        
+        Args:
+            database: Path to the SQLite database file
+            size: Maximum number of open connections
+            readonly: Whether connections should reject writes
+        """
+        self.database = database
+        self.readonly = readonly
+        self._pool = queue.Queue(maxsize=size)
+        for _ in range(size):
+            self._pool.put(None)
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open and configure a new connection."""
+        conn = sqlite3.connect(self.database, check_same_thread=False, isolation_level=None)
+        if self.readonly:
+            conn.execute('PRAGMA query_only=ON')
+        else:
+            # WAL lets readers proceed while the writer commits
+            conn.execute('PRAGMA journal_mode=WAL')
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(f'PRAGMA {pragma}')
+        return conn
+    
+    @contextmanager
+    def acquire(self):
+        """Check out a connection, returning it to the pool afterwards."""
+        conn = self._pool.get()
+        try:
+            if conn is None:
+                conn = self._connect()
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+
+# SQLite allows a single writer alongside many concurrent readers
+WRITE_POOL = SqlitePool(DATABASE, size=1)
+READ_POOL = SqlitePool(DATABASE, size=os.cpu_count() or 4, readonly=True)
+
+# Analysis rows are persisted off the request path by a background writer
+WRITE_QUEUE_SIZE = 10000
+WRITE_BATCH_SIZE = 200
+WRITE_Q: queue.Queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+_writer_thread = None
+
 
 def init_database():
     """Initialize SQLite database for storing analysis results."""
     os.makedirs('data', exist_ok=True)
     
-    conn = sqlite3.connect(DATABASE)
+    with WRITE_POOL.acquire() as conn:
+        _create_tables(conn)
+    
+    _start_writer()
+
+
+def _create_tables(conn: sqlite3.Connection):
+    """Create database tables if they do not exist."""
     cursor = conn.cursor()
     
     # Create analysis results table
@@ -87,36 +243,164 @@ def init_database():
         )
     ''')
     
-    conn.commit()
-    conn.close()
+    # Indexes for history listing and dashboard aggregation
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_hist_ts
+        ON analysis_history(timestamp DESC)
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_hist_sentiment
+        ON analysis_history(sentiment)
+    ''')
+
+
+def get_analyzer(method: str) -> SentimentAnalyzer:
+    """Get the shared analyzer for a method, falling back to ensemble."""
+    if method not in ANALYSIS_METHODS:
+        return ANALYZERS['ensemble']
+    
+    shared = ANALYZERS.get(method)
+    if shared is None:
+        with _analyzers_lock:
+            shared = ANALYZERS.get(method)
+            if shared is None:
+                shared = SentimentAnalyzer(method=method)
+                ANALYZERS[method] = shared
+    return shared
+
+
+@functools.lru_cache(maxsize=4096)
+def _analyze_cached(text: str, method: str) -> SentimentResult:
+    """Analyze text with the shared analyzer, memoizing repeated inputs."""
+    return get_analyzer(method).analyze(text)
+
+
+def analyze_cached(text: str, method: str) -> SentimentResult:
+    """Get the (possibly cached) analysis result for a text and method."""
+    if method not in ANALYSIS_METHODS:
+        method = 'ensemble'
+    start = time.perf_counter()
+    result = _analyze_cached(text, method)
+    # Every cache hit shares one result: hand out a private scores dict, and
+    # report the time this call took rather than the first call's model time
+    return dataclasses.replace(
+        result, scores=dict(result.scores), processing_time=time.perf_counter() - start
+    )
+
+
+def analyze_reviews(texts: List[str]) -> List[Optional[SentimentResult]]:
+    """
+    Analyze review texts in parallel chunks with the shared ensemble analyzer.
+    
+    Args:
+        texts: Review texts to analyze
+        
+    Returns:
+        Results aligned with texts, with None for chunks that failed
+    """
+    chunks = [texts[i:i + ANALYSIS_CHUNK_SIZE] for i in range(0, len(texts), ANALYSIS_CHUNK_SIZE)]
+    futures = [analysis_executor.submit(analyzer.analyze_batch, chunk) for chunk in chunks]
+    
+    results: List[Optional[SentimentResult]] = []
+    for chunk, future in zip(chunks, futures):
+        try:
+            results.extend(future.result())
+        except Exception as e:
+            logger.error(f"Error analyzing review chunk: {e}")
+            results.extend([None] * len(chunk))
+    
+    return results
+
+
+def _analysis_row(result: SentimentResult, source_url: str = None, platform: str = None) -> Tuple:
+    """Build an analysis_history row from an analysis result."""
+    return (
+        result.text,
+        result.sentiment.value,
+        result.confidence,
+        orjson.dumps(result.scores).decode('utf-8'),
+        result.method,
+        result.processing_time,
+        source_url,
+        platform
+    )
 
 
 def save_analysis_result(result: SentimentResult, source_url: str = None, platform: str = None):
     """Save analysis result to database."""
+    save_analysis_results([_analysis_row(result, source_url, platform)])
+
+
+def save_analysis_results(rows: List[Tuple]):
+    """Queue multiple analysis rows for the background writer."""
+    if not rows:
+        return
+    
+    # Write synchronously until the writer is running
+    if _writer_thread is None:
+        _insert_rows(rows)
+        return
+    
+    for i, row in enumerate(rows):
+        try:
+            WRITE_Q.put_nowait(row)
+        except queue.Full:
+            logger.warning("Write queue full, saving analysis results synchronously")
+            _insert_rows(rows[i:])
+            break
+
+
+def _insert_rows(rows: List[Tuple]):
+    """Insert analysis rows into the database in a single transaction."""
     try:
-        conn = sqlite3.connect(DATABASE)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO analysis_history 
-            (text, sentiment, confidence, scores, method, processing_time, source_url, platform)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            result.text,
-            result.sentiment.value,
-            result.confidence,
-            json.dumps(result.scores),
-            result.method,
-            result.processing_time,
-            source_url,
-            platform
-        ))
-        
-        conn.commit()
-        conn.close()
+        with WRITE_POOL.acquire() as conn:
+            conn.execute('BEGIN')
+            try:
+                conn.executemany(INSERT_ANALYSIS_SQL, rows)
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
         
     except Exception as e:
-        logger.error(f"Error saving analysis result: {e}")
+        logger.error(f"Error saving analysis results: {e}")
+
+
+def _drain_write_queue(first_row: Tuple = None) -> List[Tuple]:
+    """Collect up to WRITE_BATCH_SIZE queued rows without blocking."""
+    rows = [first_row] if first_row is not None else []
+    while len(rows) < WRITE_BATCH_SIZE:
+        try:
+            rows.append(WRITE_Q.get_nowait())
+        except queue.Empty:
+            break
+    return rows
+
+
+def _writer_loop():
+    """Persist queued analysis rows, coalescing bursts into one transaction."""
+    while True:
+        _insert_rows(_drain_write_queue(WRITE_Q.get()))
+
+
+def _start_writer():
+    """Start the background writer thread if it is not already running."""
+    global _writer_thread
+    
+    if _writer_thread is not None and _writer_thread.is_alive():
+        return
+    
+    _writer_thread = threading.Thread(target=_writer_loop, name='feelnet-db-writer', daemon=True)
+    _writer_thread.start()
+
+
+@atexit.register
+def _flush_write_queue():
+    """Write any rows still queued when the process exits."""
+    rows = _drain_write_queue()
+    while rows:
+        _insert_rows(rows)
+        rows = _drain_write_queue()
 
 
 # Web Routes
@@ -137,9 +421,12 @@ def analyze_text():
             flash('Please enter some text to analyze.', 'error')
             return redirect(url_for('index'))
         
-        # Create analyzer with specified method
-        temp_analyzer = SentimentAnalyzer(method=method)
-        result = temp_analyzer.analyze(text)
+        if len(text) > MAX_TEXT_LENGTH:
+            flash(f'Text too long. Max {MAX_TEXT_LENGTH} characters.', 'error')
+            return redirect(url_for('index'))
+        
+        # Repeated texts are served from the result cache
+        result = analyze_cached(text, method)
         
         # Save result to database
         save_analysis_result(result)
@@ -180,10 +467,9 @@ def scrape_submit():
         return redirect(url_for('scrape_reviews'))
 
     results = []
-    if analyze_flag:
-        for rev in reviews:
-            res = analyzer.analyze(rev.text)
-            results.append({'review': rev, 'sentiment': res})
+    if analyze_flag and reviews:
+        sentiments = analyze_reviews([rev.text for rev in reviews])
+        results = [{'review': rev, 'sentiment': res} for rev, res in zip(reviews, sentiments) if res is not None]
     stats = analyzer.get_statistics([r['sentiment'] for r in results]) if results else {}
     return render_template('scrape_results.html', url=url, results=results, stats=stats)
 
@@ -192,37 +478,38 @@ def scrape_submit():
 def analysis_history():
     """View analysis history."""
     try:
-        conn = sqlite3.connect(DATABASE)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT * FROM analysis_history 
-            ORDER BY timestamp DESC 
-            LIMIT 100
-        ''')
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        # Convert rows to simple objects so Jinja can use dot notation
-        import types, json as _json
-        history = []
-        for row in rows:
-            obj_dict = {
-                'id': row[0],
-                'text': row[1],
-                'sentiment': row[2],
-                'confidence': row[3],
-                'scores': _json.loads(row[4]) if row[4] else {},
-                'method': row[5],
-                'processing_time': row[6],
-                'timestamp': row[7],
-                'source_url': row[8],
-                'platform': row[9],
-            }
-            history.append(types.SimpleNamespace(**obj_dict))
-        
-        return render_template('history.html', history=history)
+        page = max(request.args.get('page', 1, type=int), 1)
+        size = min(max(request.args.get('size', HISTORY_PAGE_SIZE, type=int), 1), HISTORY_MAX_PAGE_SIZE)
+        
+        with READ_POOL.acquire() as conn:
+            cursor = conn.execute('''
+                SELECT id, text, sentiment, confidence, method, timestamp
+                FROM analysis_history 
+                ORDER BY timestamp DESC 
+                LIMIT ? OFFSET ?
+            ''', (size, (page - 1) * size))
+            
+            # Convert rows to simple objects so Jinja can use dot notation
+            import types
+            history = [
+                types.SimpleNamespace(
+                    id=row[0],
+                    text=row[1],
+                    sentiment=row[2],
+                    confidence=row[3],
+                    method=row[4],
+                    timestamp=row[5],
+                )
+                for row in cursor
+            ]
+        
+        return Response(stream_template(
+            'history.html',
+            history=history,
+            page=page,
+            size=size,
+            has_next=len(history) == size
+        ))
         
     except Exception as e:
         logger.error(f"Error fetching history: {e}")
@@ -234,36 +521,27 @@ def analysis_history():
 def dashboard():
     """Analytics dashboard."""
     try:
-        conn = sqlite3.connect(DATABASE)
-        cursor = conn.cursor()
-        
-        # Get sentiment distribution
-        cursor.execute('''
-            SELECT sentiment, COUNT(*) as count 
-            FROM analysis_history 
-            GROUP BY sentiment
-        ''')
-        sentiment_dist = dict(cursor.fetchall())
-        
-        # Get analysis by method
-        cursor.execute('''
-            SELECT method, COUNT(*) as count 
-            FROM analysis_history 
-            GROUP BY method
-        ''')
-        method_dist = dict(cursor.fetchall())
-        
-        # Get recent activity
-        cursor.execute('''
-            SELECT DATE(timestamp) as date, COUNT(*) as count 
-            FROM analysis_history 
-            WHERE timestamp >= datetime('now', '-30 days')
-            GROUP BY DATE(timestamp)
-            ORDER BY date DESC
-        ''')
-        activity = cursor.fetchall()
-        
-        conn.close()
+        with READ_POOL.acquire() as conn:
+            # Single scan grouped by every dimension the dashboard needs;
+            # the date is only kept for the last 30 days of activity
+            rows = conn.execute('''
+                SELECT sentiment, method,
+                       CASE WHEN timestamp >= datetime('now', '-30 days')
+                            THEN DATE(timestamp) END AS date,
+                       COUNT(*) as count
+                FROM analysis_history
+                GROUP BY sentiment, method, date
+            ''').fetchall()
+        
+        sentiment_dist: Dict[str, int] = {}
+        method_dist: Dict[str, int] = {}
+        recent_activity: Dict[str, int] = {}
+        for sentiment, method, date, count in rows:
+            sentiment_dist[sentiment] = sentiment_dist.get(sentiment, 0) + count
+            method_dist[method] = method_dist.get(method, 0) + count
+            if date is not None:
+                recent_activity[date] = recent_activity.get(date, 0) + count
+        activity = sorted(recent_activity.items(), reverse=True)
         
         # Calculate stats for template
         total_analyses = sum(sentiment_dist.values()) if sentiment_dist else 0
@@ -298,9 +576,19 @@ def api_analyze():
         text = data['text']
         method = data.get('method', 'ensemble')
         
-        # Create analyzer with specified method
-        temp_analyzer = SentimentAnalyzer(method=method)
-        result = temp_analyzer.analyze(text)
+        # Reject trivial and oversized input before touching the models
+        if not isinstance(text, str) or not text.strip():
+            return jsonify({'error': 'Text cannot be empty'}), 400
+        
+        if len(text) > MAX_TEXT_LENGTH:
+            return jsonify({
+                'error': f'Text too long. Max {MAX_TEXT_LENGTH} chars',
+                'max_length': MAX_TEXT_LENGTH,
+                'length': len(text)
+            }), 413
+        
+        # Repeated texts are served from the result cache
+        result = analyze_cached(text, method)
         
         # Save result
         save_analysis_result(result)
@@ -334,13 +622,19 @@ def api_analyze_batch():
         if not isinstance(texts, list):
             return jsonify({'error': 'Texts must be an array'}), 400
         
-        # Create analyzer
-        temp_analyzer = SentimentAnalyzer(method=method)
-        results = temp_analyzer.analyze_batch(texts)
+        if not all(isinstance(text, str) for text in texts):
+            return jsonify({'error': 'Texts must be strings'}), 400
+        
+        # Use shared analyzer for the specified method
+        temp_analyzer = get_analyzer(method)
+        
+        # Analyze each distinct text once, then scatter back in request order
+        unique_texts = list(dict.fromkeys(texts))
+        unique_results = dict(zip(unique_texts, temp_analyzer.analyze_batch(unique_texts)))
+        results = [unique_results[text] for text in texts]
         
         # Save results
-        for result in results:
-            save_analysis_result(result)
+        save_analysis_results([_analysis_row(result) for result in results])
         
         # Format response
         response_data = []
@@ -390,12 +684,17 @@ def api_scrape():
         if not reviews:
             return jsonify({'error': 'No reviews found'}), 404
         
-        # Analyze sentiment
+        # Analyze sentiment in parallel chunks
+        sentiment_results = analyze_reviews([r.text for r in reviews])
+        
         results = []
-        for review in reviews:
+        rows = []
+        analyzed = []
+        for review, result in zip(reviews, sentiment_results):
+            if result is None:
+                continue
             try:
-                result = analyzer.analyze(review.text)
-                save_analysis_result(result, source_url=url, platform=review.platform)
+                rows.append(_analysis_row(result, source_url=url, platform=review.platform))
                 
                 results.append({
                     'review': {
@@ -412,13 +711,15 @@ def api_scrape():
                         'scores': result.scores
                     }
                 })
+                analyzed.append(result)
             except Exception as e:
                 logger.error(f"Error analyzing review: {e}")
                 continue
         
-        # Calculate statistics
-        sentiment_results = [analyzer.analyze(r.text) for r in reviews]
-        stats = analyzer.get_statistics(sentiment_results)
+        save_analysis_results(rows)
+        
+        # Calculate statistics from the results already computed above
+        stats = analyzer.get_statistics(analyzed)
         
         return jsonify({
             'url': url,
@@ -433,17 +734,27 @@ def api_scrape():
         return jsonify({'error': str(e)}), 500
 
 
+@functools.lru_cache(maxsize=1)
+def _platforms_payload() -> Tuple[bytes, str]:
+    """Serialize supported platform info once per process."""
+    payload = orjson.dumps({
+        'supported_platforms': scraper_factory.get_supported_platforms(),
+        'scraper_info': scraper_factory.get_scraper_info()
+    })
+    return payload, hashlib.md5(payload).hexdigest()
+
+
 @app.route('/api/platforms')
 def api_platforms():
     """API endpoint to get supported platforms."""
     try:
-        platforms = scraper_factory.get_supported_platforms()
-        info = scraper_factory.get_scraper_info()
+        payload, etag = _platforms_payload()
         
-        return jsonify({
-            'supported_platforms': platforms,
-            'scraper_info': info
-        })
+        response = Response(payload, mimetype='application/json')
+        response.set_etag(etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = PLATFORMS_MAX_AGE
+        return response.make_conditional(request)
         
     except Exception as e:
         logger.error(f"API platforms error: {e}")
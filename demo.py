@@ -52,31 +52,29 @@ def demo_basic_analysis():
     # Initialize analyzer with ensemble method
     analyzer = SentimentAnalyzer(method="ensemble")
     
-    # Analyze each text
-    results = []
-    for i, text in enumerate(sample_texts, 1):
+    # Analyze all texts in one batch
+    try:
+        results = analyzer.analyze_batch(sample_texts)
+    except Exception as e:
+        print(f"   ❌ Error: {e}\n")
+        results = []
+    
+    # Display results
+    sentiment_color = {
+        'positive': '🟢',
+        'negative': '🔴', 
+        'neutral': '🟡'
+    }
+    
+    for i, result in enumerate(results, 1):
+        text = result.text
         print(f"Text {i}: {text[:50]}{'...' if len(text) > 50 else ''}")
         
-        try:
-            result = analyzer.analyze(text)
-            results.append(result)
-            
-            # Display result
-            sentiment_color = {
-                'positive': '🟢',
-                'negative': '🔴', 
-                'neutral': '🟡'
-            }
-            
-            icon = sentiment_color.get(result.sentiment.value, '⚪')
-            print(f"   {icon} Sentiment: {result.sentiment.value.upper()}")
-            print(f"   📊 Confidence: {result.confidence:.3f}")
-            print(f"   ⚡ Time: {result.processing_time:.3f}s")
-            print()
-            
-        except Exception as e:
-            print(f"   ❌ Error: {e}\n")
-            continue
+        icon = sentiment_color.get(result.sentiment.value, '⚪')
+        print(f"   {icon} Sentiment: {result.sentiment.value.upper()}")
+        print(f"   📊 Confidence: {result.confidence:.3f}")
+        print(f"   ⚡ Time: {result.processing_time:.3f}s")
+        print()
     
     # Display statistics
     if results:
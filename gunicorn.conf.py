@@ -0,0 +1,15 @@
+"""
+Gunicorn configuration for feelnet.
+
+Loaded automatically when running `gunicorn wsgi:app` from the project root.
+"""
+
+import os
+
+workers = int(os.getenv('WEB_CONCURRENCY', '4'))
+threads = int(os.getenv('GUNICORN_THREADS', '8'))
+worker_class = 'gthread'
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+# Workers read this to size their inference thread pools
+os.environ['WEB_CONCURRENCY'] = str(workers)
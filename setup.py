@@ -9,6 +9,8 @@ import os
 import sys
 import subprocess
 import logging
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
@@ -16,10 +18,10 @@ logger = logging.getLogger(__name__)
 
 
 def run_command(command, description):
-    """Run a shell command and handle errors."""
+    """Run a command given as an argv list (no shell) and handle errors."""
     logger.info(f"Running: {description}")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        result = subprocess.run(command, check=True, capture_output=True, text=True)
         if result.stdout:
             logger.info(result.stdout.strip())
         return True
@@ -28,6 +30,9 @@ def run_command(command, description):
         if e.stderr:
             logger.error(e.stderr.strip())
         return False
+    except OSError as e:
+        logger.error(f"Failed: {description}: {e}")
+        return False
 
 
 def check_python_version():
@@ -46,18 +51,37 @@ def install_dependencies():
     """Install required dependencies."""
     logger.info("Installing dependencies...")
     
-    commands = [
-        ("pip install --upgrade pip", "Upgrading pip"),
-        ("pip install -r requirements.txt", "Installing Python packages"),
+    # One resolver run upgrades pip and installs the requirements together
+    command = [
+        sys.executable, "-m", "pip", "install",
+        "--no-input", "--disable-pip-version-check",
+        "--upgrade", "pip",
+        "-r", "requirements.txt",
     ]
     
-    for command, description in commands:
-        if not run_command(command, description):
-            return False
-    
-    return True
+    return run_command(command, "Upgrading pip and installing Python packages")
 
 
+# Essential NLTK datasets and the resource paths used to detect them locally
+NLTK_DATASETS = {
+    'punkt': 'tokenizers/punkt',
+    'stopwords': 'corpora/stopwords',
+    'wordnet': 'corpora/wordnet',
+    'vader_lexicon': 'sentiment/vader_lexicon.zip',
+}
+
+
+def _ensure_nltk_dataset(nltk, dataset, resource_path):
+    """Download an NLTK dataset unless it is already installed."""
+    try:
+        nltk.data.find(resource_path)
+        return False
+    except LookupError:
+        nltk.download(dataset, quiet=True)
+        return True
+
+
+@functools.lru_cache(maxsize=None)
 def download_nltk_data():
     """Download required NLTK data."""
     logger.info("Downloading NLTK data...")
@@ -65,15 +89,22 @@ def download_nltk_data():
     try:
         import nltk
         
-        # Download essential NLTK data
-        datasets = ['punkt', 'stopwords', 'wordnet', 'vader_lexicon']
-        
-        for dataset in datasets:
-            try:
-                nltk.download(dataset, quiet=True)
-                logger.info(f"Downloaded NLTK dataset: {dataset}")
-            except Exception as e:
-                logger.warning(f"Failed to download {dataset}: {e}")
+        # Download missing NLTK data concurrently (network-bound)
+        with ThreadPoolExecutor(max_workers=len(NLTK_DATASETS)) as executor:
+            futures = {
+                executor.submit(_ensure_nltk_dataset, nltk, dataset, path): dataset
+                for dataset, path in NLTK_DATASETS.items()
+            }
+            
+            for future in as_completed(futures):
+                dataset = futures[future]
+                try:
+                    if future.result():
+                        logger.info(f"Downloaded NLTK dataset: {dataset}")
+                    else:
+                        logger.info(f"NLTK dataset already installed: {dataset}")
+                except Exception as e:
+                    logger.warning(f"Failed to download {dataset}: {e}")
         
         return True
         
@@ -5,10 +5,16 @@ This package provides comprehensive sentiment analysis capabilities for
 analyzing public opinions from online reviews and survey responses.
 """
 
-from .analyzers.sentiment_analyzer import SentimentAnalyzer
-from .analyzers.ensemble_analyzer import EnsembleAnalyzer
-from .scrapers.scraper_factory import ScraperFactory
-from .preprocessing.text_preprocessor import TextPreprocessor
+from ._lazy import _lazy
+
+# Public names are resolved on first access (PEP 562) so importing the
+# package does not pull in every analyzer and scraper up front.
+_LAZY = {
+    "SentimentAnalyzer": ".analyzers.sentiment_analyzer",
+    "EnsembleAnalyzer": ".analyzers.ensemble_analyzer",
+    "ScraperFactory": ".scrapers.scraper_factory",
+    "TextPreprocessor": ".preprocessing.text_preprocessor",
+}
 
 __version__ = "1.0.0"
 __author__ = "feelnet Team"
@@ -19,4 +25,7 @@ __all__ = [
     "EnsembleAnalyzer", 
     "ScraperFactory",
     "TextPreprocessor"
-] 
\ No newline at end of file
+]
+
+
+__getattr__, __dir__ = _lazy(_LAZY, globals())
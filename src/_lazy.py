@@ -0,0 +1,33 @@
+"""
+Lazy (PEP 562) re-exports shared by the feelnet packages.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def _lazy(module_map: Dict[str, str], namespace: Dict[str, Any]) -> Tuple[Callable, Callable]:
+    """
+    Build module-level __getattr__ and __dir__ that import names on first access.
+    
+    Args:
+        module_map: Public name -> module path, relative to the package
+        namespace: The package's globals(); resolved names are cached in it
+            so later lookups bypass __getattr__
+    
+    Returns:
+        Tuple of (__getattr__, __dir__) to assign in the package
+    """
+    package = namespace['__name__']
+    
+    def __getattr__(name: str) -> Any:
+        if name in module_map:
+            value = getattr(importlib.import_module(module_map[name], package), name)
+            namespace[name] = value
+            return value
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+    
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(namespace.get('__all__', module_map)))
+    
+    return __getattr__, __dir__
@@ -5,16 +5,29 @@ This module contains various sentiment analysis approaches including
 rule-based, machine learning, and transformer-based models.
 """
 
-from .sentiment_analyzer import SentimentAnalyzer
-from .ensemble_analyzer import EnsembleAnalyzer
-from .vader_analyzer import VaderAnalyzer
-from .textblob_analyzer import TextBlobAnalyzer
-from .transformer_analyzer import TransformerAnalyzer
+from .._lazy import _lazy
+
+# Analyzers are imported on first access (PEP 562) so callers that only
+# need one backend do not pay for loading the others.
+_LAZY = {
+    "SentimentAnalyzer": ".sentiment_analyzer",
+    "EnsembleAnalyzer": ".ensemble_analyzer",
+    "HybridAnalyzer": ".hybrid_analyzer",
+    "VaderAnalyzer": ".vader_analyzer",
+    "TextBlobAnalyzer": ".textblob_analyzer",
+    "TransformerAnalyzer": ".transformer_analyzer",
+    "SentimentLabel": ".labels",
+}
 
 __all__ = [
     "SentimentAnalyzer",
     "EnsembleAnalyzer",
+    "HybridAnalyzer",
     "VaderAnalyzer", 
     "TextBlobAnalyzer",
-    "TransformerAnalyzer"
-] 
\ No newline at end of file
+    "TransformerAnalyzer",
+    "SentimentLabel"
+]
+
+
+__getattr__, __dir__ = _lazy(_LAZY, globals())
@@ -2,19 +2,18 @@
 Ensemble analyzer that combines multiple sentiment analysis methods.
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import math
+
+import numpy as np
 
 from .vader_analyzer import VaderAnalyzer
 from .textblob_analyzer import TextBlobAnalyzer
 from .transformer_analyzer import TransformerAnalyzer
-from enum import Enum
-
-class SentimentLabel(Enum):
-    """Sentiment classification labels."""
-    POSITIVE = "positive"
-    NEGATIVE = "negative"
-    NEUTRAL = "neutral"
+from .labels import SentimentLabel
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +25,10 @@ class EnsembleAnalyzer:
     Uses weighted voting from VADER, TextBlob, and Transformer models.
     """
     
+    # Score slots used by the vote arrays
+    _LABELS = ('positive', 'negative', 'neutral')
+    _IDX = {label: i for i, label in enumerate(_LABELS)}
+    
     def __init__(self, 
                  use_vader: bool = True,
                  use_textblob: bool = True,
@@ -64,6 +67,11 @@ class EnsembleAnalyzer:
         if total_weight > 0:
             self.weights = {k: v / total_weight for k, v in self.weights.items()}
         
+        # Analyzers and weights frozen in one aligned order for vectorized voting
+        self._names = tuple(self.analyzers)
+        self._analyzer_objs = tuple(self.analyzers[name] for name in self._names)
+        self._weights_np = np.array([self.weights[name] for name in self._names], dtype=np.float64)
+        
         logger.info(f"Ensemble analyzer initialized with {len(self.analyzers)} methods")
     
     def analyze(self, text: str) -> Dict:
@@ -80,40 +88,121 @@ class EnsembleAnalyzer:
             raise ValueError("No analyzers configured")
         
         individual_results = {}
-        combined_scores = {'positive': 0.0, 'negative': 0.0, 'neutral': 0.0}
+        votes = np.zeros((len(self._names), len(self._LABELS)))
         
         # Get results from each analyzer
-        for name, analyzer in self.analyzers.items():
+        for i, (name, analyzer) in enumerate(zip(self._names, self._analyzer_objs)):
             try:
                 result = analyzer.analyze(text)
+                for label, score in result['scores'].items():
+                    votes[i, self._IDX[label]] = score
                 individual_results[name] = result
-                
-                # Combine scores using weights
-                weight = self.weights.get(name, 0.0)
-                for sentiment, score in result['scores'].items():
-                    combined_scores[sentiment] += score * weight
                     
             except Exception as e:
                 logger.warning(f"Error in {name} analyzer: {e}")
+                votes[i] = 0.0
                 continue
         
+        # Combine scores using weights: (n_analyzers,) @ (n_analyzers, 3).
+        # Failed analyzers keep a zero row, which drops them from the normalized vote.
+        combined = self._weights_np @ votes
+        
         # Normalize combined scores
-        total = sum(combined_scores.values())
+        total = combined.sum()
         if total > 0:
-            combined_scores = {k: v / total for k, v in combined_scores.items()}
+            combined /= total
         
         # Determine final sentiment
-        final_sentiment = max(combined_scores, key=combined_scores.get)
-        confidence = combined_scores[final_sentiment]
+        final_idx = int(combined.argmax())
+        confidence = float(combined[final_idx])
+        combined_scores = {label: float(score) for label, score in zip(self._LABELS, combined)}
         
         return {
-            'sentiment': SentimentLabel(final_sentiment),
+            'sentiment': SentimentLabel(self._LABELS[final_idx]),
             'confidence': confidence,
             'scores': combined_scores,
             'individual_results': individual_results,
             'method': 'ensemble'
         }
     
+    def analyze_batch(self, texts: List[str]) -> List[Dict]:
+        """
+        Analyze sentiment of multiple texts using the ensemble.
+        
+        The transformer runs one batched forward pass on a worker thread
+        while the rule-based analyzers process the texts on this thread;
+        the weighted vote for every text is then computed in one einsum.
+        
+        Args:
+            texts: Input texts to analyze
+            
+        Returns:
+            List of ensemble result dictionaries aligned with texts
+        """
+        if not self.analyzers:
+            raise ValueError("No analyzers configured")
+        
+        per_analyzer: Dict[str, List[Optional[Dict]]] = {}
+        transformer = self.analyzers.get('transformer')
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            transformer_future = None
+            if transformer is not None:
+                transformer_future = executor.submit(transformer.analyze_batch, texts)
+            
+            for name, analyzer in zip(self._names, self._analyzer_objs):
+                if analyzer is transformer:
+                    continue
+                per_analyzer[name] = self._analyze_each(name, analyzer, texts)
+            
+            if transformer_future is not None:
+                try:
+                    per_analyzer['transformer'] = transformer_future.result()
+                except Exception as e:
+                    logger.warning(f"Error in transformer analyzer: {e}")
+        
+        # Stack votes as (texts, analyzers, labels). Failed analyses stay zero,
+        # which drops them from the vote once the combined scores are normalized.
+        stacked = np.zeros((len(texts), len(self._names), len(self._LABELS)))
+        for j, name in enumerate(self._names):
+            for t, result in enumerate(per_analyzer.get(name, ())):
+                if result is not None:
+                    for label, score in result['scores'].items():
+                        stacked[t, j, self._IDX[label]] = score
+        
+        combined = np.einsum('j,tjk->tk', self._weights_np, stacked)
+        totals = combined.sum(axis=1, keepdims=True)
+        np.divide(combined, totals, out=combined, where=totals > 0)
+        final_idx = combined.argmax(axis=1)
+        
+        results = []
+        for t, idx in enumerate(final_idx):
+            individual_results = {
+                name: per_analyzer[name][t]
+                for name in self._names
+                if name in per_analyzer and per_analyzer[name][t] is not None
+            }
+            results.append({
+                'sentiment': SentimentLabel(self._LABELS[idx]),
+                'confidence': float(combined[t, idx]),
+                'scores': {label: float(score) for label, score in zip(self._LABELS, combined[t])},
+                'individual_results': individual_results,
+                'method': 'ensemble'
+            })
+        
+        return results
+    
+    def _analyze_each(self, name: str, analyzer, texts: List[str]) -> List[Optional[Dict]]:
+        """Run one analyzer over texts, recording None for texts that fail."""
+        results = []
+        for text in texts:
+            try:
+                results.append(analyzer.analyze(text))
+            except Exception as e:
+                logger.warning(f"Error in {name} analyzer: {e}")
+                results.append(None)
+        return results
+    
     def get_analyzer_performance(self, texts: List[str]) -> Dict:
         """
         Analyze performance of individual analyzers on a set of texts.
@@ -126,23 +215,19 @@ class EnsembleAnalyzer:
         """
         performance = {}
         
-        for name, analyzer in self.analyzers.items():
+        for name, analyzer in zip(self._names, self._analyzer_objs):
             try:
                 results = []
                 for text in texts:
                     result = analyzer.analyze(text)
                     results.append(result)
                 
-                # Calculate metrics
-                confidences = [r['confidence'] for r in results]
-                avg_confidence = sum(confidences) / len(confidences)
+                # Calculate metrics in a single pass over the label list
+                n = len(results) or 1
+                avg_confidence = math.fsum(r['confidence'] for r in results) / n
                 
-                sentiments = [r['sentiment'].value for r in results]
-                sentiment_dist = {
-                    'positive': sentiments.count('positive') / len(sentiments),
-                    'negative': sentiments.count('negative') / len(sentiments),
-                    'neutral': sentiments.count('neutral') / len(sentiments)
-                }
+                counts = Counter(r['sentiment'].value for r in results)
+                sentiment_dist = {label: counts.get(label, 0) / n for label in self._LABELS}
                 
                 performance[name] = {
                     'average_confidence': avg_confidence,
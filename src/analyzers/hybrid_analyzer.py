@@ -0,0 +1,94 @@
+"""
+Hybrid analyzer that only sends ambiguous texts to the transformer.
+VADER settles clear-cut texts in microseconds; the transformer forward
+pass is reserved for the texts VADER cannot call confidently.
+"""
+
+from typing import Dict, List
+import logging
+
+from .vader_analyzer import VaderAnalyzer
+from .transformer_analyzer import TransformerAnalyzer
+
+logger = logging.getLogger(__name__)
+
+# Texts with |VADER compound| below this are routed to the transformer
+AMBIGUITY_THRESHOLD = 0.4
+
+
+class HybridAnalyzer:
+    """
+    Two-stage sentiment analyzer.
+    
+    Every text is scored by VADER first; only texts whose compound score
+    is within the ambiguity threshold of zero are forwarded to the
+    transformer model.
+    """
+    
+    def __init__(self, threshold: float = AMBIGUITY_THRESHOLD):
+        """
+        Initialize hybrid analyzer.
+        
+        Args:
+            threshold: Absolute VADER compound score below which a text is
+                considered ambiguous and analyzed by the transformer
+        """
+        self.threshold = threshold
+        self.vader = VaderAnalyzer()
+        self.transformer = TransformerAnalyzer()
+        
+        logger.info(f"Hybrid analyzer initialized with threshold {threshold}")
+    
+    def analyze(self, text: str) -> Dict:
+        """
+        Analyze sentiment, escalating to the transformer only if needed.
+        
+        Args:
+            text: Input text to analyze
+        
+        Returns:
+            Dictionary containing sentiment analysis results
+        """
+        vader_result = self.vader.analyze(text)
+        if not self._is_ambiguous(vader_result):
+            return self._tag(vader_result, 'vader')
+        
+        return self._tag(self.transformer.analyze(text), 'transformer')
+    
+    def analyze_batch(self, texts: List[str]) -> List[Dict]:
+        """
+        Analyze multiple texts, batching only the ambiguous ones.
+        
+        Args:
+            texts: Input texts to analyze
+        
+        Returns:
+            List of result dictionaries aligned with texts
+        """
+        vader_results = [self.vader.analyze(text) for text in texts]
+        ambiguous = [i for i, result in enumerate(vader_results) if self._is_ambiguous(result)]
+        
+        results = [self._tag(result, 'vader') for result in vader_results]
+        if not ambiguous:
+            return results
+        
+        try:
+            transformer_results = self.transformer.analyze_batch([texts[i] for i in ambiguous])
+        except Exception as e:
+            # Keep the VADER verdicts rather than failing the whole batch
+            logger.warning(f"Error in transformer analyzer, keeping VADER results: {e}")
+            return results
+        
+        for i, result in zip(ambiguous, transformer_results):
+            results[i] = self._tag(result, 'transformer')
+        
+        logger.debug(f"Hybrid batch routed {len(ambiguous)}/{len(texts)} texts to the transformer")
+        return results
+    
+    def _is_ambiguous(self, vader_result: Dict) -> bool:
+        """Check whether a VADER result is too weak to trust on its own."""
+        return abs(vader_result['compound']) < self.threshold
+    
+    def _tag(self, result: Dict, routed_to: str) -> Dict:
+        """Copy a stage result, recording which stage produced it."""
+        return {**result, 'method': 'hybrid', 'routed_to': routed_to}
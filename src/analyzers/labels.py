@@ -0,0 +1,12 @@
+"""
+Sentiment labels shared by all analyzers.
+"""
+
+from enum import Enum
+
+
+class SentimentLabel(Enum):
+    """Sentiment classification labels."""
+    POSITIVE = "positive"
+    NEGATIVE = "negative"
+    NEUTRAL = "neutral"
@@ -5,35 +5,122 @@ for different sentiment analysis approaches.
 
 from typing import Dict, List, Union, Optional
 import logging
+import threading
+import time
 from dataclasses import dataclass
-from enum import Enum
 
+import numpy as np
+
+from .labels import SentimentLabel
 from .vader_analyzer import VaderAnalyzer
 from .textblob_analyzer import TextBlobAnalyzer
 from .transformer_analyzer import TransformerAnalyzer
+from .ensemble_analyzer import EnsembleAnalyzer
+from .hybrid_analyzer import HybridAnalyzer
 from ..preprocessing.text_preprocessor import TextPreprocessor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Methods whose backend implements analyze_batch with batched model inference
+BATCHED_METHODS = ('ensemble', 'transformer', 'hybrid')
 
-class SentimentLabel(Enum):
-    """Sentiment classification labels."""
-    POSITIVE = "positive"
-    NEGATIVE = "negative"
-    NEUTRAL = "neutral"
+# Fixed label order used for array-based aggregation
+_LABEL_ORDER = tuple(label.value for label in SentimentLabel)
+_LABEL_INDEX = {label: i for i, label in enumerate(_LABEL_ORDER)}
 
 
-@dataclass
+@dataclass(frozen=True)
 class SentimentResult:
     """Container for sentiment analysis results."""
+    # Explicit __slots__ (rather than slots=True, which needs Python 3.10) drops the
+    # per-instance __dict__. Frozen only blocks rebinding fields: scores is still a
+    # plain dict, so callers sharing a result must copy it before mutating.
+    __slots__ = ('text', 'sentiment', 'confidence', 'scores', 'method', 'processing_time')
+    
     text: str
     sentiment: SentimentLabel
     confidence: float
     scores: Dict[str, float]
     method: str
     processing_time: float
+    
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state):
+        # The frozen __setattr__ would reject the default slot restore used
+        # by pickle and copy.deepcopy
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+@dataclass(frozen=True)
+class SentimentResultBatch:
+    """
+    Column-oriented results for a batch of texts.
+    
+    Labels are indices into _LABEL_ORDER and scores columns follow the same
+    order, so batch statistics reduce over contiguous arrays.
+    """
+    texts: List[str]
+    labels: np.ndarray
+    confidences: np.ndarray
+    scores: np.ndarray
+    processing_times: np.ndarray
+    method: str
+    
+    def __len__(self) -> int:
+        return len(self.texts)
+    
+    @classmethod
+    def from_results(cls, results: List[SentimentResult], method: str) -> 'SentimentResultBatch':
+        """
+        Build a columnar batch from per-text results.
+        
+        Args:
+            results: List of sentiment analysis results
+            method: Analysis method that produced the results
+            
+        Returns:
+            SentimentResultBatch holding the same data
+        """
+        n = len(results)
+        scores = np.zeros((n, len(_LABEL_ORDER)), dtype=np.float64)
+        for row, r in zip(scores, results):
+            for label, score in r.scores.items():
+                row[_LABEL_INDEX[label]] = score
+        
+        return cls(
+            texts=[r.text for r in results],
+            labels=np.fromiter((_LABEL_INDEX[r.sentiment.value] for r in results), dtype=np.int8, count=n),
+            confidences=np.fromiter((r.confidence for r in results), dtype=np.float64, count=n),
+            scores=scores,
+            processing_times=np.fromiter((r.processing_time for r in results), dtype=np.float64, count=n),
+            method=method
+        )
+    
+    def to_results(self) -> List[SentimentResult]:
+        """
+        Expand the batch back into per-text results.
+        
+        Returns:
+            List of SentimentResult objects
+        """
+        return [
+            SentimentResult(
+                text=text,
+                sentiment=SentimentLabel(_LABEL_ORDER[label]),
+                confidence=float(confidence),
+                scores={name: float(score) for name, score in zip(_LABEL_ORDER, row)},
+                method=self.method,
+                processing_time=float(processing_time)
+            )
+            for text, label, confidence, row, processing_time in zip(
+                self.texts, self.labels, self.confidences, self.scores, self.processing_times
+            )
+        ]
 
 
 class SentimentAnalyzer:
@@ -47,19 +134,23 @@ class SentimentAnalyzer:
         Initialize the sentiment analyzer.
         
         Args:
-            method: Analysis method ('vader', 'textblob', 'transformer', 'ensemble')
+            method: Analysis method ('vader', 'textblob', 'transformer', 'ensemble', 'hybrid')
             preprocess: Whether to preprocess text before analysis
         """
         self.method = method
         self.preprocess = preprocess
         self.preprocessor = TextPreprocessor() if preprocess else None
         
-        # Initialize analyzers
-        self.analyzers = {
-            'vader': VaderAnalyzer(),
-            'textblob': TextBlobAnalyzer(),
-            'transformer': TransformerAnalyzer()
+        # Analyzers are built on first use so e.g. method="vader" never loads the transformer model
+        self._factory = {
+            'vader': VaderAnalyzer,
+            'textblob': TextBlobAnalyzer,
+            'transformer': TransformerAnalyzer,
+            'ensemble': EnsembleAnalyzer,
+            'hybrid': HybridAnalyzer
         }
+        self.analyzers = {}
+        self._analyzers_lock = threading.Lock()
         
         logger.info(f"SentimentAnalyzer initialized with method: {method}")
     
@@ -73,8 +164,7 @@ class SentimentAnalyzer:
         Returns:
             SentimentResult containing analysis results
         """
-        import time
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # Preprocess text if enabled
         processed_text = text
@@ -82,15 +172,12 @@ class SentimentAnalyzer:
             processed_text = self.preprocessor.preprocess(text)
         
         # Perform analysis based on selected method
-        if self.method == "ensemble":
-            result = self._ensemble_analyze(processed_text)
-        else:
-            analyzer = self.analyzers.get(self.method)
-            if not analyzer:
-                raise ValueError(f"Unknown analysis method: {self.method}")
-            result = analyzer.analyze(processed_text)
+        analyzer = self._get(self.method)
+        if not analyzer:
+            raise ValueError(f"Unknown analysis method: {self.method}")
+        result = analyzer.analyze(processed_text)
         
-        processing_time = time.time() - start_time
+        processing_time = (time.perf_counter_ns() - start_ns) * 1e-9
         
         return SentimentResult(
             text=text,
@@ -101,19 +188,42 @@ class SentimentAnalyzer:
             processing_time=processing_time
         )
     
-    def analyze_batch(self, texts: List[str]) -> List[SentimentResult]:
+    def analyze_batch(self, texts: List[str],
+                      columnar: bool = False) -> Union[List[SentimentResult], SentimentResultBatch]:
         """
         Analyze sentiment of multiple texts.
         
+        Args:
+            texts: List of input texts
+            columnar: Return a SentimentResultBatch instead of a list
+            
+        Returns:
+            List of SentimentResult objects, or a SentimentResultBatch if columnar
+        """
+        results = self._analyze_rows(texts)
+        if columnar:
+            return SentimentResultBatch.from_results(results, self.method)
+        return results
+    
+    def _analyze_rows(self, texts: List[str]) -> List[SentimentResult]:
+        """
+        Analyze multiple texts into per-text results.
+        
         Args:
             texts: List of input texts
             
         Returns:
             List of SentimentResult objects
         """
-        results = []
         logger.info(f"Analyzing batch of {len(texts)} texts")
         
+        if self.method in BATCHED_METHODS and texts:
+            try:
+                return self._batched_analyze(texts)
+            except Exception as e:
+                logger.error(f"Error in batched {self.method} analysis, analyzing texts individually: {e}")
+        
+        results = []
         for i, text in enumerate(texts):
             try:
                 result = self.analyze(text)
@@ -124,77 +234,79 @@ class SentimentAnalyzer:
                     
             except Exception as e:
                 logger.error(f"Error analyzing text {i}: {e}")
-                # Create error result
-                results.append(SentimentResult(
-                    text=text,
-                    sentiment=SentimentLabel.NEUTRAL,
-                    confidence=0.0,
-                    scores={'positive': 0.0, 'negative': 0.0, 'neutral': 1.0},
-                    method=self.method,
-                    processing_time=0.0
-                ))
+                results.append(self._error_result(text))
         
         return results
     
-    def _ensemble_analyze(self, text: str) -> Dict:
+    def _get(self, name: str):
         """
-        Perform ensemble analysis using multiple methods.
+        Return the named analyzer, instantiating it on first use.
         
         Args:
-            text: Preprocessed text to analyze
+            name: Analyzer name ('vader', 'textblob', 'transformer', 'ensemble')
             
         Returns:
-            Dictionary with combined results
+            Analyzer instance, or None if the name is unknown
         """
-        results = {}
-        scores = {'positive': 0.0, 'negative': 0.0, 'neutral': 0.0}
-        
-        # Get results from all analyzers
-        for name, analyzer in self.analyzers.items():
-            try:
-                result = analyzer.analyze(text)
-                results[name] = result
-                
-                # Aggregate scores (weighted average)
-                weight = self._get_analyzer_weight(name)
-                for sentiment, score in result['scores'].items():
-                    scores[sentiment] += score * weight
-                    
-            except Exception as e:
-                logger.warning(f"Error in {name} analyzer: {e}")
-                continue
-        
-        # Normalize scores
-        total = sum(scores.values())
-        if total > 0:
-            scores = {k: v / total for k, v in scores.items()}
-        
-        # Determine final sentiment
-        sentiment_label = max(scores, key=scores.get)
-        confidence = scores[sentiment_label]
-        
-        return {
-            'sentiment': SentimentLabel(sentiment_label),
-            'confidence': confidence,
-            'scores': scores,
-            'individual_results': results
-        }
+        analyzer = self.analyzers.get(name)
+        if analyzer is None and name in self._factory:
+            with self._analyzers_lock:
+                analyzer = self.analyzers.get(name)
+                if analyzer is None:
+                    analyzer = self._factory[name]()
+                    self.analyzers[name] = analyzer
+        return analyzer
     
-    def _get_analyzer_weight(self, analyzer_name: str) -> float:
-        """Get weight for each analyzer in ensemble."""
-        weights = {
-            'vader': 0.4,      # Good for social media text
-            'textblob': 0.3,   # Good for general text
-            'transformer': 0.3  # Most accurate but slower
-        }
-        return weights.get(analyzer_name, 0.33)
+    def _error_result(self, text: str) -> SentimentResult:
+        """Create a neutral placeholder result for a text that failed analysis."""
+        return SentimentResult(
+            text=text,
+            sentiment=SentimentLabel.NEUTRAL,
+            confidence=0.0,
+            scores={'positive': 0.0, 'negative': 0.0, 'neutral': 1.0},
+            method=self.method,
+            processing_time=0.0
+        )
+    
+    def _batched_analyze(self, texts: List[str]) -> List[SentimentResult]:
+        """
+        Analyze a batch of texts with a backend that supports batched inference.
+        
+        Args:
+            texts: Input texts to analyze
+            
+        Returns:
+            List of SentimentResult objects aligned with texts
+        """
+        start_ns = time.perf_counter_ns()
+        
+        processed_texts = texts
+        if self.preprocess and self.preprocessor:
+            processed_texts = self.preprocessor.preprocess_batch(texts)
+        
+        combined_results = self._get(self.method).analyze_batch(processed_texts)
+        
+        # Batch time is shared evenly between texts
+        processing_time = (time.perf_counter_ns() - start_ns) * 1e-9 / len(texts)
+        
+        return [
+            SentimentResult(
+                text=text,
+                sentiment=combined['sentiment'],
+                confidence=combined['confidence'],
+                scores=combined['scores'],
+                method=self.method,
+                processing_time=processing_time
+            )
+            for text, combined in zip(texts, combined_results)
+        ]
     
-    def get_statistics(self, results: List[SentimentResult]) -> Dict:
+    def get_statistics(self, results: Union[List[SentimentResult], SentimentResultBatch]) -> Dict:
         """
         Calculate statistics from a batch of results.
         
         Args:
-            results: List of sentiment analysis results
+            results: List of sentiment analysis results, or a columnar batch
             
         Returns:
             Dictionary containing various statistics
@@ -202,20 +314,22 @@ class SentimentAnalyzer:
         if not results:
             return {}
         
-        sentiments = [r.sentiment.value for r in results]
-        confidences = [r.confidence for r in results]
-        processing_times = [r.processing_time for r in results]
+        if not isinstance(results, SentimentResultBatch):
+            results = SentimentResultBatch.from_results(results, self.method)
+        
+        # Reductions over the batch's contiguous columns
+        n = len(results)
+        distribution = np.bincount(results.labels, minlength=len(_LABEL_ORDER)) / n
+        total_processing_time = float(results.processing_times.sum())
         
         stats = {
-            'total_analyzed': len(results),
+            'total_analyzed': n,
             'sentiment_distribution': {
-                'positive': sentiments.count('positive') / len(sentiments),
-                'negative': sentiments.count('negative') / len(sentiments),
-                'neutral': sentiments.count('neutral') / len(sentiments)
+                label: float(distribution[i]) for i, label in enumerate(_LABEL_ORDER)
             },
-            'average_confidence': sum(confidences) / len(confidences),
-            'total_processing_time': sum(processing_times),
-            'average_processing_time': sum(processing_times) / len(processing_times)
+            'average_confidence': float(results.confidences.mean()),
+            'total_processing_time': total_processing_time,
+            'average_processing_time': total_processing_time / n
         }
         
         return stats 
\ No newline at end of file
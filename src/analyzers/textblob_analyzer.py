@@ -3,15 +3,33 @@ TextBlob sentiment analyzer.
 Uses TextBlob's built-in sentiment analysis which is based on movie reviews.
 """
 
-from typing import Dict
-from textblob import TextBlob
-from enum import Enum
+import functools
+from typing import Dict, Tuple
+from textblob.sentiments import PatternAnalyzer
+from .labels import SentimentLabel
 
-class SentimentLabel(Enum):
-    """Sentiment classification labels."""
-    POSITIVE = "positive"
-    NEGATIVE = "negative"
-    NEUTRAL = "neutral"
+# TextBlob polarity is deterministic per input, so repeated short reviews
+# ("great!", "ok") are served from this cache instead of re-tagging.
+SCORE_CACHE_SIZE = 16384
+
+# TextBlob's default sentiment analyzer, called directly so each text skips
+# building a full TextBlob (tokenizer, tagger, parser wiring)
+_PATTERN_ANALYZER = PatternAnalyzer()
+
+
+@functools.lru_cache(maxsize=SCORE_CACHE_SIZE)
+def _textblob_scores(text: str) -> Tuple[float, float]:
+    """
+    Compute (polarity, subjectivity) for a text, memoized.
+    
+    Args:
+        text: Input text to analyze
+        
+    Returns:
+        Tuple of polarity (-1 to 1) and subjectivity (0 to 1)
+    """
+    sentiment = _PATTERN_ANALYZER.analyze(text)
+    return sentiment.polarity, sentiment.subjectivity
 
 
 class TextBlobAnalyzer:
@@ -36,12 +54,8 @@ class TextBlobAnalyzer:
         Returns:
             Dictionary containing sentiment analysis results
         """
-        # Create TextBlob object
-        blob = TextBlob(text)
-        
         # Get polarity (-1 to 1) and subjectivity (0 to 1)
-        polarity = blob.sentiment.polarity
-        subjectivity = blob.sentiment.subjectivity
+        polarity, subjectivity = _textblob_scores(text)
         
         # Determine sentiment based on polarity
         if polarity > 0.1:
@@ -54,30 +68,17 @@ class TextBlobAnalyzer:
             sentiment = SentimentLabel.NEUTRAL
             confidence = 1 - abs(polarity)
         
-        # Convert polarity to probability-like scores
-        # Normalize polarity from [-1, 1] to [0, 1] range
-        normalized_polarity = (polarity + 1) / 2
-        
-        # Create score distribution
-        if polarity > 0:
-            pos_score = normalized_polarity
-            neg_score = 1 - normalized_polarity
-            neu_score = (1 - abs(polarity)) * 0.5  # Neutral component
-        elif polarity < 0:
-            pos_score = normalized_polarity  
-            neg_score = 1 - normalized_polarity
-            neu_score = (1 - abs(polarity)) * 0.5
+        # Convert polarity to probability-like scores: positive/negative split
+        # the [-1, 1] range and sum to 1, neutral shrinks as |polarity| grows.
+        # Exactly-zero polarity keeps the flat prior.
+        if polarity == 0:
+            pos_score, neg_score, neu_score = 0.33, 0.33, 0.34
         else:
-            pos_score = 0.33
-            neg_score = 0.33
-            neu_score = 0.34
-        
-        # Normalize scores to sum to 1
-        total = pos_score + neg_score + neu_score
-        if total > 0:
-            pos_score /= total
-            neg_score /= total
-            neu_score /= total
+            neu_score = (1 - abs(polarity)) * 0.5
+            inv_total = 1 / (1 + neu_score)
+            pos_score = (1 + polarity) * 0.5 * inv_total
+            neg_score = (1 - polarity) * 0.5 * inv_total
+            neu_score *= inv_total
         
         sentiment_scores = {
             'positive': pos_score,
@@ -3,22 +3,194 @@ Transformer-based sentiment analyzer using pre-trained models.
 Provides state-of-the-art accuracy for sentiment classification.
 """
 
+import contextlib
+import hashlib
 import os
+import threading
+from collections import OrderedDict
 os.environ.setdefault("TRANSFORMERS_NO_TF","1")
 os.environ.setdefault("TRANSFORMERS_NO_FLAX","1")
 
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import logging
-from enum import Enum
 
-class SentimentLabel(Enum):
-    """Sentiment classification labels."""
-    POSITIVE = "positive"
-    NEGATIVE = "negative"
-    NEUTRAL = "neutral"
+import numpy as np
+
+from .labels import SentimentLabel
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Fixed score order; the first label wins ties, matching dict insertion order
+_LABELS = ('positive', 'negative', 'neutral')
+
+# Model token limit; the tokenizer truncates inputs to this many tokens
+MAX_LENGTH = 512
+
+# Padded sequence lengths a CUDA graph is captured for (see _CudaGraphRunner)
+SEQ_LEN_BUCKETS = (64, 128, 256, MAX_LENGTH)
+
+# Number of distinct texts whose model outputs are kept in memory
+RESULT_CACHE_SIZE = 16384
+
+# Where exported/quantized ONNX models are cached between runs
+ONNX_CACHE_DIR = os.path.join(os.getenv("FEELNET_MODEL_DIR", "models"), "onnx")
+
+# Keywords for the rule-based fallback used when no model could be loaded
+POSITIVE_WORDS = frozenset(['good', 'great', 'excellent', 'amazing', 'wonderful',
+                            'fantastic', 'love', 'like', 'best', 'awesome'])
+NEGATIVE_WORDS = frozenset(['bad', 'terrible', 'awful', 'horrible', 'hate',
+                            'worst', 'poor', 'disappointing', 'sad', 'angry'])
+
+
+# Each keyword owns one bit, so the keywords found in a text fold into one int
+KEYWORD_BITS = {word: 1 << i for i, word in enumerate(sorted(POSITIVE_WORDS | NEGATIVE_WORDS))}
+POSITIVE_MASK = sum(KEYWORD_BITS[word] for word in POSITIVE_WORDS)
+NEGATIVE_MASK = sum(KEYWORD_BITS[word] for word in NEGATIVE_WORDS)
+
+# int.bit_count (C popcount) needs Python 3.10
+_popcount = int.bit_count if hasattr(int, 'bit_count') else (lambda mask: bin(mask).count('1'))
+
+
+def _build_keyword_matcher():
+    """
+    Build a function returning the bitmask of keywords that occur in a lowercased text.
+    
+    Uses a single-pass Aho-Corasick automaton when pyahocorasick is installed,
+    otherwise plain per-word substring checks (C-level str.__contains__, which
+    benchmarks faster than a regex alternation or np.char for 20 keywords).
+    """
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for word, bit in KEYWORD_BITS.items():
+            automaton.add_word(word, bit)
+        automaton.make_automaton()
+        
+        def match(text: str) -> int:
+            mask = 0
+            for _, bit in automaton.iter(text):
+                mask |= bit
+            return mask
+        
+        return match
+    
+    keyword_bits = tuple(KEYWORD_BITS.items())
+    return lambda text: sum(bit for word, bit in keyword_bits if word in text)
+
+
+_match_keywords = _build_keyword_matcher()
+
+
+def _to_label_scores(labels: List[str], probabilities: List[List[float]]) -> List[List[Dict]]:
+    """Shape per-text class probabilities like pipeline(top_k=None) output."""
+    return [
+        [{'label': label, 'score': score} for label, score in zip(labels, row)]
+        for row in probabilities
+    ]
+
+
+class _CudaGraphRunner:
+    """
+    Run the model forward pass by replaying captured CUDA graphs.
+    
+    Batches are padded to a fixed batch size and to the next length in
+    SEQ_LEN_BUCKETS, so each bucket is captured once; later calls copy
+    the token ids into the graph's static input tensors and replay it,
+    skipping the per-kernel launch overhead that dominates short inputs.
+    """
+    
+    def __init__(self, torch, model, tokenizer, batch_size: int):
+        """
+        Initialize the runner.
+        
+        Args:
+            torch: The imported torch module
+            model: Sequence classification model already on a CUDA device
+            tokenizer: Tokenizer matching the model
+            batch_size: Static batch dimension of the captured graphs
+        """
+        self.torch = torch
+        self.model = model
+        self.tokenizer = tokenizer
+        self.batch_size = batch_size
+        self.device = next(model.parameters()).device
+        self.input_names = list(tokenizer.model_input_names)
+        self.labels = [model.config.id2label[i] for i in range(model.config.num_labels)]
+        # Bucket length -> (graph, static inputs, static logits)
+        self._graphs: Dict[int, Tuple[Any, Dict[str, Any], Any]] = {}
+        # Static buffers are shared by every replay of a graph
+        self._lock = threading.Lock()
+    
+    def _capture(self, seq_len: int) -> Tuple[Any, Dict[str, Any], Any]:
+        """
+        Capture the forward pass for one padded sequence length.
+        
+        Args:
+            seq_len: Padded sequence length of the graph's inputs
+            
+        Returns:
+            Tuple of (graph, static input tensors, static logits tensor)
+        """
+        torch = self.torch
+        static_inputs = {
+            name: torch.zeros((self.batch_size, seq_len), dtype=torch.long, device=self.device)
+            for name in self.input_names
+        }
+        
+        # Warm up on a side stream so lazy allocations happen before capture
+        stream = torch.cuda.Stream()
+        stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(stream):
+            for _ in range(3):
+                self.model(**static_inputs)
+        torch.cuda.current_stream().wait_stream(stream)
+        
+        graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(graph):
+            static_logits = self.model(**static_inputs).logits
+        
+        logger.info(f"Captured CUDA graph for batch {self.batch_size} x {seq_len} tokens")
+        return graph, static_inputs, static_logits
+    
+    def __call__(self, texts: List[str]) -> List[List[Dict]]:
+        """
+        Score texts, returning pipeline-style output.
+        
+        Args:
+            texts: Input texts
+            
+        Returns:
+            One list of label/score dicts per text, like pipeline(top_k=None)
+        """
+        results = []
+        for start in range(0, len(texts), self.batch_size):
+            chunk = texts[start:start + self.batch_size]
+            encoded = self.tokenizer(chunk, truncation=True, max_length=MAX_LENGTH,
+                                     padding=True, return_tensors="pt")
+            n, seq_len = encoded["input_ids"].shape
+            bucket = next(length for length in SEQ_LEN_BUCKETS if length >= seq_len)
+            
+            with self._lock:
+                entry = self._graphs.get(bucket)
+                if entry is None:
+                    entry = self._graphs[bucket] = self._capture(bucket)
+                graph, static_inputs, static_logits = entry
+                
+                # Zeroed padding has attention_mask 0, so it does not affect real rows
+                for name, buffer in static_inputs.items():
+                    buffer.zero_()
+                    buffer[:n, :seq_len].copy_(encoded[name].pin_memory(), non_blocking=True)
+                graph.replay()
+                probabilities = static_logits[:n].float().softmax(dim=-1).tolist()
+            
+            results.extend(_to_label_scores(self.labels, probabilities))
+        return results
+
 
 class TransformerAnalyzer:
     """
@@ -28,43 +200,215 @@ class TransformerAnalyzer:
     Default model is optimized for English text sentiment classification.
     """
     
-    def __init__(self, model_name: str = "distilbert-base-uncased-finetuned-sst-2-english"):
+    # Loaded models shared by every instance in the process, keyed by (model_name,
+    # backend, quantize): (model, tokenizer, device, inference context, graph runner)
+    _model_cache: Dict[Tuple, Tuple[Any, Any, Any, Any, Any]] = {}
+    _model_cache_lock = threading.Lock()
+    
+    def __init__(self, 
+                 model_name: str = "distilbert-base-uncased-finetuned-sst-2-english",
+                 backend: Optional[str] = None,
+                 batch_size: Optional[int] = None,
+                 quantize: Optional[bool] = None):
         """
         Initialize transformer analyzer.
         
         Args:
             model_name: Name of the pre-trained model to use
+            backend: Inference backend ('pt' or 'onnx'); defaults to the
+                TRANSFORMER_BACKEND environment variable, then 'pt'
+            batch_size: Texts per forward pass in analyze_batch; defaults to
+                the TRANSFORMER_BATCH_SIZE environment variable, then 32
+            quantize: Apply dynamic INT8 quantization when running PyTorch on
+                CPU; defaults to the TRANSFORMER_QUANTIZE environment variable, then True
         """
         self.model_name = model_name
-        self.pipeline = None
+        self.backend = (backend or os.getenv("TRANSFORMER_BACKEND", "pt")).lower()
+        self.batch_size = batch_size or int(os.getenv("TRANSFORMER_BATCH_SIZE", "32"))
+        if quantize is None:
+            quantize = os.getenv("TRANSFORMER_QUANTIZE", "true").lower() in ("1", "true", "yes")
+        self.quantize = quantize
+        self.model = None
+        self.tokenizer = None
+        self.device = "cpu"
+        # Set on CUDA when TRANSFORMER_CUDA_GRAPHS is enabled; used by analyze_batch
+        self._graph_runner: Optional[_CudaGraphRunner] = None
+        # Context wrapped around forward passes; torch.inference_mode once torch is loaded
+        self._inference_context = contextlib.nullcontext
+        # Text digest -> ((label, score), ...) from the model, in LRU order
+        self._cache: "OrderedDict[bytes, Tuple]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         self._initialize_model()
     
     def _initialize_model(self):
-        """Initialize the transformer model pipeline."""
+        """Initialize the transformer model, reusing one already loaded in this process."""
+        key = (self.model_name, self.backend, self.quantize)
+        cls = type(self)
+        
+        # Held while loading so concurrent instances wait for one load instead of racing
+        with cls._model_cache_lock:
+            shared = cls._model_cache.get(key)
+            if shared is not None:
+                (self.model, self.tokenizer, self.device,
+                 self._inference_context, self._graph_runner) = shared
+                logger.info(f"Reusing loaded transformer model: {self.model_name}")
+                return
+            
+            self._load_model()
+            if self.model is not None:
+                cls._model_cache[key] = (
+                    self.model, self.tokenizer, self.device,
+                    self._inference_context, self._graph_runner
+                )
+    
+    def _load_model(self):
+        """Load the sequence classification model and its fast tokenizer."""
+        if self.backend == "onnx":
+            try:
+                self.model, self.tokenizer = self._load_onnx_model()
+                logger.info("Quantized ONNX transformer model loaded successfully")
+                return
+            except Exception as e:
+                logger.warning(f"ONNX backend unavailable, falling back to PyTorch: {e}")
+        
         try:
-            from transformers import pipeline  # lazy import
-            logger.info(f"Loading transformer model: {self.model_name}")
-            self.pipeline = pipeline(
-                "sentiment-analysis",
-                model=self.model_name,
-                tokenizer=self.model_name,
-                return_all_scores=True
-            )
+            import torch  # lazy import
+            from transformers import AutoModelForSequenceClassification, AutoTokenizer  # lazy import
+        except ImportError as e:
+            logger.error(f"Error loading transformer model: {e}")
+            return
+        
+        self.device = self._select_device(torch)
+        self._inference_context = torch.inference_mode
+        # Half precision only pays off (and is only safe) on an accelerator
+        dtype = torch.float16 if self.device != "cpu" else torch.float32
+        
+        def load(model_name):
+            model = AutoModelForSequenceClassification.from_pretrained(model_name, torch_dtype=dtype)
+            self.model = model.to(self.device).eval()
+            self.tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
+        
+        try:
+            logger.info(f"Loading transformer model: {self.model_name} (device: {self.device})")
+            load(self.model_name)
             logger.info("Transformer model loaded successfully")
         except Exception as e:
             logger.error(f"Error loading transformer model: {e}")
             # Fallback to a simpler model
             try:
                 logger.info("Trying fallback model...")
-                self.pipeline = pipeline(
-                    "sentiment-analysis",
-                    model="distilbert-base-uncased-finetuned-sst-2-english",
-                    return_all_scores=True
-                )
+                load("distilbert-base-uncased-finetuned-sst-2-english")
                 logger.info("Fallback model loaded successfully")
             except Exception as e2:
                 logger.error(f"Error loading fallback model: {e2}")
-                self.pipeline = None
+                self.model = self.tokenizer = None
+                return
+        
+        if self.quantize and self.device == "cpu":
+            self._quantize_dynamic(torch)
+        if os.getenv("TRANSFORMER_COMPILE", "false").lower() in ("1", "true", "yes"):
+            self._compile_model(torch)
+        if (self.device == "cuda"
+                and os.getenv("TRANSFORMER_CUDA_GRAPHS", "false").lower() in ("1", "true", "yes")):
+            self._graph_runner = _CudaGraphRunner(torch, self.model, self.tokenizer, self.batch_size)
+            logger.info("CUDA graph replay enabled for batched inference")
+    
+    def _quantize_dynamic(self, torch):
+        """
+        Replace the model's Linear layers with dynamic INT8 versions.
+        
+        Args:
+            torch: The imported torch module
+        """
+        try:
+            self.model = torch.quantization.quantize_dynamic(
+                self.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+            logger.info("Applied dynamic INT8 quantization to transformer model")
+        except Exception as e:
+            logger.warning(f"Dynamic quantization failed, using FP32 model: {e}")
+    
+    def _compile_model(self, torch):
+        """
+        Compile the model with torch.compile; instances sharing the model
+        reuse the compiled graph.
+        
+        Args:
+            torch: The imported torch module
+        """
+        if not hasattr(torch, "compile"):
+            logger.warning("torch.compile requires PyTorch 2.0, using eager model")
+            return
+        try:
+            self.model = torch.compile(self.model, mode="reduce-overhead")
+            logger.info("Compiled transformer model with torch.compile")
+        except Exception as e:
+            logger.warning(f"torch.compile failed, using eager model: {e}")
+    
+    @staticmethod
+    def _select_device(torch):
+        """
+        Pick the fastest available device for the model.
+        
+        Args:
+            torch: The imported torch module
+            
+        Returns:
+            "cuda" for the default CUDA GPU, "mps" on Apple silicon, or "cpu"
+        """
+        if torch.cuda.is_available():
+            return "cuda"
+        mps = getattr(torch.backends, "mps", None)
+        if mps is not None and mps.is_available():
+            return "mps"
+        return "cpu"
+    
+    def _load_onnx_model(self):
+        """
+        Load an optimized, INT8-quantized ONNX Runtime model and its tokenizer.
+        
+        On first use the model is exported, graph-optimized (attention and
+        LayerNorm fusion) and dynamically quantized, then loaded from
+        ONNX_CACHE_DIR on subsequent runs.
+        
+        Returns:
+            Tuple of (ORTModelForSequenceClassification, tokenizer)
+        """
+        import platform
+        from transformers import AutoTokenizer
+        from optimum.onnxruntime import ORTModelForSequenceClassification, ORTOptimizer, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig, OptimizationConfig
+        
+        save_dir = os.path.join(ONNX_CACHE_DIR, self.model_name.replace("/", "--"))
+        optimized_file = "model_optimized.onnx"
+        quantized_file = "model_optimized_quantized.onnx"
+        provider = "CPUExecutionProvider"
+        
+        if not os.path.exists(os.path.join(save_dir, quantized_file)):
+            logger.info(f"Exporting, optimizing and quantizing {self.model_name} to ONNX")
+            model = ORTModelForSequenceClassification.from_pretrained(
+                self.model_name, export=True, provider=provider
+            )
+            
+            ORTOptimizer.from_pretrained(model).optimize(
+                save_dir=save_dir,
+                optimization_config=OptimizationConfig(optimization_level=99)
+            )
+            
+            if platform.machine().lower() in ("arm64", "aarch64"):
+                qconfig = AutoQuantizationConfig.arm64(is_static=False, per_channel=False)
+            else:
+                qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            
+            quantizer = ORTQuantizer.from_pretrained(save_dir, file_name=optimized_file)
+            quantizer.quantize(save_dir=save_dir, quantization_config=qconfig)
+            model.config.save_pretrained(save_dir)
+        
+        model = ORTModelForSequenceClassification.from_pretrained(
+            save_dir, file_name=quantized_file, provider=provider
+        )
+        tokenizer = AutoTokenizer.from_pretrained(self.model_name, use_fast=True)
+        return model, tokenizer
     
     def analyze(self, text: str) -> Dict:
         """
@@ -76,43 +420,170 @@ class TransformerAnalyzer:
         Returns:
             Dictionary containing sentiment analysis results
         """
-        if not self.pipeline:
+        if self.model is None:
             # Fallback to simple rule-based approach if model failed to load
             return self._fallback_analysis(text)
         
         try:
-            # Truncate text if too long (transformer models have token limits)
-            max_length = 512
-            if len(text) > max_length:
-                text = text[:max_length]
-            
-            # Get predictions
-            results = self.pipeline(text)[0]  # Get first (and only) result
-            
-            # Parse results based on model type
-            sentiment_scores = self._parse_results(results)
-            
-            # Determine primary sentiment
-            primary_sentiment = max(sentiment_scores, key=sentiment_scores.get)
-            confidence = sentiment_scores[primary_sentiment]
-            
-            return {
-                'sentiment': SentimentLabel(primary_sentiment),
-                'confidence': confidence,
-                'scores': sentiment_scores,
-                'raw_results': results
-            }
+            cached = self._cache_get(text)
+            if cached is not None:
+                return self._build_result(cached)
+            
+            with self._inference_context():
+                results = self._forward([text], 1)[0]
+            
+            self._cache_put(text, results)
+            return self._build_result(results)
             
         except Exception as e:
             logger.error(f"Error in transformer analysis: {e}")
             return self._fallback_analysis(text)
     
+    def analyze_batch(self, texts: List[str], batch_size: Optional[int] = None) -> List[Dict]:
+        """
+        Analyze sentiment of multiple texts with batched model inference.
+        
+        Args:
+            texts: Input texts to analyze
+            batch_size: Number of texts per forward pass (defaults to self.batch_size;
+                CUDA graph replay always uses the captured batch size)
+            
+        Returns:
+            List of result dictionaries aligned with texts
+        """
+        if not texts:
+            return []
+        
+        if self.model is None:
+            return self._fallback_analysis_batch(texts)
+        
+        try:
+            # Run the model once per distinct text that is not already cached
+            raw_by_text = {}
+            misses = []
+            for text in dict.fromkeys(texts):
+                cached = self._cache_get(text)
+                if cached is None:
+                    misses.append(text)
+                else:
+                    raw_by_text[text] = cached
+            
+            if misses:
+                # Feed texts shortest-first so each batch pads to a similar (batch-longest)
+                # length, using character length as a cheap proxy for token count
+                misses.sort(key=len)
+                with self._inference_context():
+                    if self._graph_runner is not None:
+                        batch_results = self._graph_runner(misses)
+                    else:
+                        batch_results = self._forward(misses, batch_size or self.batch_size)
+                for text, raw in zip(misses, batch_results):
+                    self._cache_put(text, raw)
+                    raw_by_text[text] = raw
+            
+            return [self._build_result(raw_by_text[text]) for text in texts]
+            
+        except Exception as e:
+            logger.error(f"Error in batched transformer analysis: {e}")
+            return [self.analyze(text) for text in texts]
+    
+    def _forward(self, texts: List[str], batch_size: int) -> List[List[Dict]]:
+        """
+        Score texts with the model, one forward pass per batch.
+        
+        Each batch is encoded by the fast (Rust) tokenizer in a single call.
+        
+        Args:
+            texts: Input texts
+            batch_size: Number of texts per forward pass
+            
+        Returns:
+            One list of label/score dicts per text, like pipeline(top_k=None)
+        """
+        model = self.model
+        labels = [model.config.id2label[i] for i in range(model.config.num_labels)]
+        
+        results = []
+        for start in range(0, len(texts), batch_size):
+            # Torch tensors serve both backends: the ONNX Runtime model accepts and
+            # returns them (converting to numpy internally) and always runs on the
+            # CPU provider, where self.device stays "cpu" and .to() is a no-op
+            encoded = self.tokenizer(texts[start:start + batch_size], padding=True, truncation=True,
+                                     max_length=MAX_LENGTH, return_tensors="pt").to(self.device)
+            logits = model(**encoded).logits
+            results.extend(_to_label_scores(labels, logits.float().softmax(dim=-1).tolist()))
+        return results
+    
+    @staticmethod
+    def _cache_key(text: str) -> bytes:
+        """Fixed-size cache key, so long reviews are not held in memory as keys."""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+    
+    def _cache_get(self, text: str) -> Optional[List[Dict]]:
+        """
+        Look up cached model output for a text.
+        
+        Args:
+            text: Input text
+            
+        Returns:
+            Fresh list of label/score dicts, or None on a cache miss
+        """
+        key = self._cache_key(text)
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            self._cache.move_to_end(key)
+        return [{'label': label, 'score': score} for label, score in entry]
+    
+    def _cache_put(self, text: str, results: List[Dict]):
+        """
+        Store model output for a text, evicting the least recently used entry.
+        
+        Args:
+            text: Input text
+            results: Raw label scores for the text from the model
+        """
+        key = self._cache_key(text)
+        entry = tuple((r['label'], r['score']) for r in results)
+        with self._cache_lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > RESULT_CACHE_SIZE:
+                self._cache.popitem(last=False)
+    
+    def _build_result(self, results) -> Dict:
+        """
+        Build the analysis result for a single text from raw model output.
+        
+        Args:
+            results: Raw scores for one text from the transformer model
+            
+        Returns:
+            Dictionary containing sentiment analysis results
+        """
+        # Parse results based on model type
+        sentiment_scores = self._parse_results(results)
+        
+        # Determine primary sentiment (argmax over the fixed label slots)
+        values = [sentiment_scores[label] for label in _LABELS]
+        confidence = max(values)
+        primary_sentiment = _LABELS[values.index(confidence)]
+        
+        return {
+            'sentiment': SentimentLabel(primary_sentiment),
+            'confidence': confidence,
+            'scores': sentiment_scores,
+            'raw_results': results
+        }
+    
     def _parse_results(self, results) -> Dict[str, float]:
         """
         Parse transformer model results into standard format.
         
         Args:
-            results: Raw results from transformer pipeline
+            results: Raw results from transformer model
             
         Returns:
             Dictionary with normalized sentiment scores
@@ -159,15 +630,10 @@ class TransformerAnalyzer:
         Returns:
             Dictionary with basic sentiment analysis
         """
-        # Simple keyword-based approach as fallback
-        positive_words = ['good', 'great', 'excellent', 'amazing', 'wonderful', 
-                         'fantastic', 'love', 'like', 'best', 'awesome']
-        negative_words = ['bad', 'terrible', 'awful', 'horrible', 'hate', 
-                         'worst', 'poor', 'disappointing', 'sad', 'angry']
-        
-        text_lower = text.lower()
-        pos_count = sum(1 for word in positive_words if word in text_lower)
-        neg_count = sum(1 for word in negative_words if word in text_lower)
+        # Simple keyword-based approach as fallback: count distinct keywords present
+        found = _match_keywords(text.lower())
+        pos_count = _popcount(found & POSITIVE_MASK)
+        neg_count = _popcount(found & NEGATIVE_MASK)
         
         total_words = len(text.split())
         
@@ -194,4 +660,53 @@ class TransformerAnalyzer:
             'confidence': confidence,
             'scores': scores,
             'fallback': True
-        } 
\ No newline at end of file
+        }
+    
+    def _fallback_analysis_batch(self, texts: List[str]) -> List[Dict]:
+        """
+        Fallback analysis for a batch of texts.
+        
+        Keyword counting is done per text; the sentiment, confidence and
+        score rules of _fallback_analysis are then applied as array operations.
+        
+        Args:
+            texts: Input texts to analyze
+            
+        Returns:
+            List of dictionaries with basic sentiment analysis, aligned with texts
+        """
+        n = len(texts)
+        pos_count = np.empty(n)
+        neg_count = np.empty(n)
+        total_words = np.empty(n)
+        for i, text in enumerate(texts):
+            found = _match_keywords(text.lower())
+            pos_count[i] = _popcount(found & POSITIVE_MASK)
+            neg_count[i] = _popcount(found & NEGATIVE_MASK)
+            total_words[i] = len(text.split())
+        
+        # Label indices follow _LABELS: 0 positive, 1 negative, 2 neutral
+        label_idx = np.where(pos_count > neg_count, 0, np.where(neg_count > pos_count, 1, 2))
+        denom = np.maximum(total_words * 0.1, 1)
+        confidence = np.select(
+            [label_idx == 0, label_idx == 1],
+            [np.minimum(0.8, pos_count / denom), np.minimum(0.8, neg_count / denom)],
+            default=0.6
+        )
+        
+        remainder = 1 - confidence
+        scores = np.empty((n, len(_LABELS)))
+        scores[:, 0] = np.where(label_idx == 0, confidence, remainder * 0.3)
+        scores[:, 1] = np.where(label_idx == 1, confidence, remainder * 0.3)
+        scores[:, 2] = remainder * 0.7
+        scores[label_idx == 2] = (0.3, 0.3, 0.4)
+        
+        return [
+            {
+                'sentiment': SentimentLabel(_LABELS[idx]),
+                'confidence': conf,
+                'scores': dict(zip(_LABELS, row)),
+                'fallback': True
+            }
+            for idx, conf, row in zip(label_idx.tolist(), confidence.tolist(), scores.tolist())
+        ]
@@ -3,15 +3,13 @@ VADER (Valence Aware Dictionary and sEntiment Reasoner) sentiment analyzer.
 Particularly good for social media text and informal language.
 """
 
-from typing import Dict
+import functools
+from typing import Dict, Tuple
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-from enum import Enum
+from .labels import SentimentLabel
 
-class SentimentLabel(Enum):
-    """Sentiment classification labels."""
-    POSITIVE = "positive"
-    NEGATIVE = "negative"
-    NEUTRAL = "neutral"
+# Upper bound on memoized texts per analyzer instance
+SCORE_CACHE_SIZE = 16384
 
 
 class VaderAnalyzer:
@@ -25,6 +23,21 @@ class VaderAnalyzer:
     def __init__(self):
         """Initialize VADER analyzer."""
         self.analyzer = SentimentIntensityAnalyzer()
+        # VADER scores are deterministic per input; memoize repeated texts
+        self._polarity_scores = functools.lru_cache(maxsize=SCORE_CACHE_SIZE)(self._score)
+    
+    def _score(self, text: str) -> Tuple[float, float, float, float]:
+        """
+        Run VADER on a text.
+        
+        Args:
+            text: Input text to analyze
+            
+        Returns:
+            Tuple of (neg, neu, pos, compound) scores
+        """
+        scores = self.analyzer.polarity_scores(text)
+        return scores['neg'], scores['neu'], scores['pos'], scores['compound']
     
     def analyze(self, text: str) -> Dict:
         """
@@ -36,8 +49,9 @@ class VaderAnalyzer:
         Returns:
             Dictionary containing sentiment analysis results
         """
-        # Get VADER scores
-        scores = self.analyzer.polarity_scores(text)
+        # Get VADER scores (rebuilt per call so callers never share the cached values)
+        neg, neu, pos, compound = self._polarity_scores(text)
+        scores = {'neg': neg, 'neu': neu, 'pos': pos, 'compound': compound}
         
         # VADER returns: neg, neu, pos, compound
         # compound score is the normalized, weighted composite score
@@ -5,16 +5,25 @@ This module contains scrapers for various platforms including
 Amazon, IMDb, TripAdvisor and other review sites.
 """
 
-from .scraper_factory import ScraperFactory
-from .amazon_scraper import AmazonScraper
-from .imdb_scraper import IMDbScraper
-from .tripadvisor_scraper import TripAdvisorScraper
-from .base_scraper import BaseScraper
+from .._lazy import _lazy
+
+# Scrapers are imported on first access (PEP 562) so importing the package
+# does not load every scraper (and Selenium for Amazon) up front.
+_LAZY = {
+    "ScraperFactory": ".scraper_factory",
+    "AmazonScraper": ".amazon_scraper",
+    "IMDbScraper": ".imdb_scraper",
+    "TripAdvisorScraper": ".tripadvisor_scraper",
+    "BaseScraper": ".base_scraper",
+}
 
 __all__ = [
     "ScraperFactory",
-    "AmazonScraper", 
+    "AmazonScraper",
     "IMDbScraper",
     "TripAdvisorScraper",
     "BaseScraper"
-] 
\ No newline at end of file
+]
+
+
+__getattr__, __dir__ = _lazy(_LAZY, globals())
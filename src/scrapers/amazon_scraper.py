@@ -3,17 +3,54 @@ Amazon scraper for extracting product reviews.
 """
 
 import re
+import asyncio
+from io import BytesIO
 from typing import List, Dict
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 import logging
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 
-from .base_scraper import BaseScraper, ReviewData
+from .base_scraper import BaseScraper, ReviewData, HTTPX_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
+MAX_REVIEW_PAGES = 10
+REVIEWS_PER_PAGE = 10
+
+_FLOAT_RE = re.compile(r'\d+\.?\d*')
+_INT_RE = re.compile(r'\d+')
+_ASIN_RE = re.compile(r'/dp/([A-Z0-9]{10})')
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching elements whose class list contains ``name``."""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+# Compiled once; each lookup below is a single C-level XPath evaluation
+_REVIEWS_LINK_XP = etree.XPath('//a[@data-hook="see-all-reviews-link-foot"]/@href')
+_REVIEW_BODY_XP = etree.XPath('.//span[@data-hook="review-body"]')
+_STAR_RATING_XP = etree.XPath('.//i[contains(@class, "a-icon-star")]')
+_AUTHOR_XP = etree.XPath(f'.//span[{_has_class("a-profile-name")}]')
+_REVIEW_DATE_XP = etree.XPath('.//span[@data-hook="review-date"]')
+_REVIEW_TITLE_XP = etree.XPath('.//a[@data-hook="review-title"]')
+_HELPFUL_XP = etree.XPath('.//span[@data-hook="helpful-vote-statement"]')
+_VERIFIED_XP = etree.XPath('boolean(.//span[@data-hook="avp-badge"])')
+_SEARCH_RESULT_XP = etree.XPath('//div[@data-component-type="s-search-result"]')
+_PRODUCT_TITLE_XP = etree.XPath(f'.//h2[{_has_class("a-size-mini")}]')
+_PRODUCT_TITLE_ALT_XP = etree.XPath(f'.//span[{_has_class("a-text-normal")}]')
+_PRODUCT_LINK_XP = etree.XPath(f'.//a[{_has_class("a-link-normal")}]')
+_PRODUCT_RATING_XP = etree.XPath(f'.//span[{_has_class("a-icon-alt")}]')
+_PRODUCT_PRICE_XP = etree.XPath(f'.//span[{_has_class("a-price-whole")}]')
+
+
+def _first(xpath: etree.XPath, node):
+    """Return the first node matched by ``xpath`` under ``node``, or None."""
+    matches = xpath(node)
+    return matches[0] if matches else None
+
 
 class _SeleniumHelper:
     """Lightweight helper to get rendered HTML via headless Chrome."""
@@ -53,19 +90,19 @@ class AmazonScraper(BaseScraper):
     Note: Amazon has strong anti-scraping measures, so this is for educational purposes.
     """
     
-    def get_supported_domains(self) -> List[str]:
-        """Get supported Amazon domains."""
-        return [
-            'amazon.com',
-            'amazon.co.uk', 
-            'amazon.ca',
-            'amazon.de',
-            'amazon.fr',
-            'amazon.it',
-            'amazon.es',
-            'amazon.in',
-            'amazon.com.au'
-        ]
+    PLATFORM_NAME = 'Amazon'
+    
+    SUPPORTED_DOMAINS = frozenset({
+        'amazon.com',
+        'amazon.co.uk',
+        'amazon.ca',
+        'amazon.de',
+        'amazon.fr',
+        'amazon.it',
+        'amazon.es',
+        'amazon.in',
+        'amazon.com.au'
+    })
     
     def scrape_reviews(self, url: str, max_reviews: int = 100) -> List[ReviewData]:
         """
@@ -87,35 +124,132 @@ class AmazonScraper(BaseScraper):
                 logger.warning("Could not find reviews URL")
                 return reviews
             
-            page = 1
-            while len(reviews) < max_reviews and page <= 10:  # Limit to 10 pages
-                page_url = f"{reviews_url}&pageNumber={page}"
-                
-                # Use rendered HTML via Selenium to bypass dynamic loading
+            # Fetch all candidate pages concurrently; fall back to the
+            # Selenium renderer when httpx is missing or the plain HTTP
+            # responses carry no reviews (bot wall / dynamic loading)
+            if HTTPX_AVAILABLE:
                 try:
-                    html = _SeleniumHelper.get_html(page_url)
-                except Exception as e:
-                    logger.error(f"Selenium render error: {e}")
-                    break
-
-                soup = BeautifulSoup(html, 'html.parser')
-                page_reviews = self._extract_reviews_from_page(soup, url)
-                
-                if not page_reviews:
-                    break
-                
-                reviews.extend(page_reviews)
-                page += 1
-                
-                if len(page_reviews) < 10:  # Less than full page, probably last page
-                    break
+                    reviews = asyncio.run(
+                        self._scrape_reviews_async(reviews_url, url, max_reviews)
+                    )
+                except RuntimeError as e:
+                    # asyncio.run refuses to nest inside a running event loop
+                    logger.warning("Async fetch unavailable: %s", e)
+            
+            if not reviews:
+                reviews = self._scrape_reviews_selenium(reviews_url, url, max_reviews)
             
             return reviews[:max_reviews]
             
         except Exception as e:
-            logger.error(f"Error scraping Amazon reviews: {e}")
+            logger.error("Error scraping Amazon reviews: %s", e)
             return reviews
     
+    async def _scrape_reviews_async(self, reviews_url: str, source_url: str,
+                                    max_reviews: int) -> List[ReviewData]:
+        """
+        Fetch review pages concurrently and parse them in page order.
+        
+        Args:
+            reviews_url: Amazon reviews page URL
+            source_url: Source URL for reference
+            max_reviews: Maximum number of reviews to scrape
+            
+        Returns:
+            List of ReviewData objects
+        """
+        num_pages = min(MAX_REVIEW_PAGES, -(-max_reviews // REVIEWS_PER_PAGE))
+        pages = await self._fetch_pages_async(
+            [f"{reviews_url}&pageNumber={page}" for page in range(1, num_pages + 1)]
+        )
+        
+        reviews = []
+        for html in pages:
+            if html is None:
+                break
+            
+            page_reviews = self._extract_reviews_from_page(html, source_url)
+            
+            if not page_reviews:
+                break
+            
+            reviews.extend(page_reviews)
+            
+            if len(reviews) >= max_reviews or len(page_reviews) < REVIEWS_PER_PAGE:
+                break
+        
+        return reviews
+    
+    def _scrape_reviews_selenium(self, reviews_url: str, source_url: str,
+                                 max_reviews: int) -> List[ReviewData]:
+        """
+        Fetch review pages one at a time through headless Chrome.
+        
+        Args:
+            reviews_url: Amazon reviews page URL
+            source_url: Source URL for reference
+            max_reviews: Maximum number of reviews to scrape
+            
+        Returns:
+            List of ReviewData objects
+        """
+        reviews = []
+        
+        page = 1
+        while len(reviews) < max_reviews and page <= MAX_REVIEW_PAGES:
+            page_url = f"{reviews_url}&pageNumber={page}"
+            
+            # Use rendered HTML via Selenium to bypass dynamic loading
+            try:
+                html = _SeleniumHelper.get_html(page_url)
+            except Exception as e:
+                logger.error("Selenium render error: %s", e)
+                break
+
+            page_reviews = self._extract_reviews_from_page(html, source_url)
+            
+            if not page_reviews:
+                break
+            
+            reviews.extend(page_reviews)
+            page += 1
+            
+            if len(page_reviews) < REVIEWS_PER_PAGE:  # Less than full page, probably last page
+                break
+        
+        return reviews
+    
+    def _parse_tree(self, markup):
+        """
+        Parse HTML into an lxml tree.
+        
+        Args:
+            markup: HTML as bytes or str
+            
+        Returns:
+            Root lxml element or None if the document could not be parsed
+        """
+        try:
+            return lxml_html.fromstring(markup)
+        except (etree.ParserError, ValueError) as e:
+            logger.error("HTML parse error: %s", e)
+            return None
+    
+    def _node_text(self, element) -> str:
+        """
+        Extract whitespace-normalized text from an lxml element.
+        
+        Args:
+            element: lxml element
+            
+        Returns:
+            Cleaned text string
+        """
+        if element is None:
+            return ""
+        
+        return ' '.join(''.join(element.itertext()).split())
+    
     def _get_reviews_url(self, product_url: str) -> str:
         """
         Get the reviews page URL from product URL.
@@ -131,15 +265,15 @@ class AmazonScraper(BaseScraper):
             if not response:
                 return None
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            tree = self._parse_tree(response.content)
             
             # Look for reviews link
-            reviews_link = soup.find('a', {'data-hook': 'see-all-reviews-link-foot'})
-            if reviews_link and reviews_link.get('href'):
-                return 'https://amazon.com' + reviews_link['href']
+            reviews_href = _first(_REVIEWS_LINK_XP, tree) if tree is not None else None
+            if reviews_href:
+                return 'https://amazon.com' + reviews_href
             
             # Alternative method - construct URL from ASIN
-            asin_match = re.search(r'/dp/([A-Z0-9]{10})', product_url)
+            asin_match = _ASIN_RE.search(product_url)
             if asin_match:
                 asin = asin_match.group(1)
                 return f"https://amazon.com/product-reviews/{asin}/ref=cm_cr_dp_d_show_all_btm?ie=UTF8&reviewerType=all_reviews"
@@ -147,15 +281,61 @@ class AmazonScraper(BaseScraper):
             return None
             
         except Exception as e:
-            logger.error(f"Error getting reviews URL: {e}")
+            logger.error("Error getting reviews URL: %s", e)
             return None
     
-    def _extract_reviews_from_page(self, soup: BeautifulSoup, source_url: str) -> List[ReviewData]:
+    def _iter_review_containers(self, markup):
+        """
+        Stream-parse a reviews page, yielding each review ``<div>`` subtree.
+        
+        Only the review containers are kept alive: every other ``<div>`` and
+        each review once consumed is cleared as soon as its end tag is seen,
+        so peak memory no longer scales with the full page tree.
+        
+        Args:
+            markup: Page HTML as bytes or str
+            
+        Yields:
+            lxml elements of review containers
+        """
+        if isinstance(markup, str):
+            markup = markup.encode('utf-8')
+            encoding = 'utf-8'
+        else:
+            encoding = None  # let libxml2 honour the page's meta charset
+        
+        in_review = False
+        events = etree.iterparse(
+            BytesIO(markup), events=('start', 'end'), tag='div',
+            html=True, encoding=encoding
+        )
+        try:
+            for event, elem in events:
+                is_review = elem.get('data-hook') == 'review'
+                if event == 'start':
+                    in_review = in_review or is_review
+                    continue
+                
+                if is_review:
+                    in_review = False
+                    yield elem
+                elif in_review:
+                    continue  # still needed by the enclosing review
+                
+                elem.clear()
+                # Drop already-processed siblings so the root stays small
+                parent = elem.getparent()
+                while parent is not None and elem.getprevious() is not None:
+                    del parent[0]
+        except etree.LxmlError as e:
+            logger.error("HTML parse error: %s", e)
+    
+    def _extract_reviews_from_page(self, markup, source_url: str) -> List[ReviewData]:
         """
         Extract reviews from a reviews page.
         
         Args:
-            soup: BeautifulSoup object of the page
+            markup: Page HTML as bytes or str
             source_url: Source URL for reference
             
         Returns:
@@ -163,16 +343,13 @@ class AmazonScraper(BaseScraper):
         """
         reviews = []
         
-        # Find review containers
-        review_containers = soup.find_all('div', {'data-hook': 'review'})
-        
-        for container in review_containers:
+        for container in self._iter_review_containers(markup):
             try:
                 review = self._extract_single_review(container, source_url)
                 if review:
                     reviews.append(review)
             except Exception as e:
-                logger.error(f"Error extracting single review: {e}")
+                logger.error("Error extracting single review: %s", e)
                 continue
         
         return reviews
@@ -182,7 +359,7 @@ class AmazonScraper(BaseScraper):
         Extract a single review from its container.
         
         Args:
-            container: BeautifulSoup element containing the review
+            container: lxml element containing the review
             source_url: Source URL
             
         Returns:
@@ -190,52 +367,52 @@ class AmazonScraper(BaseScraper):
         """
         try:
             # Extract text
-            text_element = container.find('span', {'data-hook': 'review-body'})
-            if not text_element:
+            text_element = _first(_REVIEW_BODY_XP, container)
+            if text_element is None:
                 return None
             
-            text = self._extract_text(text_element)
+            text = self._node_text(text_element)
             if not text or len(text.strip()) < 10:
                 return None
             
             # Extract rating
             rating = None
-            rating_element = container.find('i', class_=re.compile(r'a-icon-star'))
-            if rating_element:
-                rating_text = rating_element.get_text()
-                rating_match = re.search(r'(\d+\.?\d*)', rating_text)
+            rating_element = _first(_STAR_RATING_XP, container)
+            if rating_element is not None:
+                rating_text = self._node_text(rating_element)
+                rating_match = _FLOAT_RE.search(rating_text)
                 if rating_match:
-                    rating = self._safe_float_convert(rating_match.group(1))
+                    rating = float(rating_match.group())
             
             # Extract author
             author = None
-            author_element = container.find('span', class_='a-profile-name')
-            if author_element:
-                author = self._extract_text(author_element)
+            author_element = _first(_AUTHOR_XP, container)
+            if author_element is not None:
+                author = self._node_text(author_element)
             
             # Extract date
             date = None
-            date_element = container.find('span', {'data-hook': 'review-date'})
-            if date_element:
-                date = self._extract_text(date_element)
+            date_element = _first(_REVIEW_DATE_XP, container)
+            if date_element is not None:
+                date = self._node_text(date_element)
             
             # Extract title
             title = None
-            title_element = container.find('a', {'data-hook': 'review-title'})
-            if title_element:
-                title = self._extract_text(title_element)
+            title_element = _first(_REVIEW_TITLE_XP, container)
+            if title_element is not None:
+                title = self._node_text(title_element)
             
             # Extract helpful votes
             helpful_votes = None
-            helpful_element = container.find('span', {'data-hook': 'helpful-vote-statement'})
-            if helpful_element:
-                helpful_text = self._extract_text(helpful_element)
-                helpful_match = re.search(r'(\d+)', helpful_text)
+            helpful_element = _first(_HELPFUL_XP, container)
+            if helpful_element is not None:
+                helpful_text = self._node_text(helpful_element)
+                helpful_match = _INT_RE.search(helpful_text)
                 if helpful_match:
-                    helpful_votes = self._safe_int_convert(helpful_match.group(1))
+                    helpful_votes = int(helpful_match.group())
             
             # Check if verified purchase
-            verified = bool(container.find('span', {'data-hook': 'avp-badge'}))
+            verified = _VERIFIED_XP(container)
             
             return ReviewData(
                 text=text,
@@ -246,11 +423,11 @@ class AmazonScraper(BaseScraper):
                 helpful_votes=helpful_votes,
                 verified=verified,
                 source_url=source_url,
-                platform='Amazon'
+                platform=self.PLATFORM_NAME
             )
             
         except Exception as e:
-            logger.error(f"Error extracting review data: {e}")
+            logger.error("Error extracting review data: %s", e)
             return None
     
     def search_products(self, query: str, max_results: int = 10) -> List[Dict]:
@@ -274,10 +451,12 @@ class AmazonScraper(BaseScraper):
             if not response:
                 return products
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            tree = self._parse_tree(response.content)
+            if tree is None:
+                return products
             
             # Find product containers
-            product_containers = soup.find_all('div', {'data-component-type': 's-search-result'})
+            product_containers = _SEARCH_RESULT_XP(tree)
             
             for container in product_containers[:max_results]:
                 try:
@@ -285,13 +464,13 @@ class AmazonScraper(BaseScraper):
                     if product:
                         products.append(product)
                 except Exception as e:
-                    logger.error(f"Error extracting product: {e}")
+                    logger.error("Error extracting product: %s", e)
                     continue
             
             return products
             
         except Exception as e:
-            logger.error(f"Error searching Amazon: {e}")
+            logger.error("Error searching Amazon: %s", e)
             return products
     
     def _extract_product_info(self, container) -> Dict:
@@ -299,39 +478,39 @@ class AmazonScraper(BaseScraper):
         Extract product information from search result container.
         
         Args:
-            container: BeautifulSoup element
+            container: lxml element of a search result
             
         Returns:
             Product information dictionary
         """
         try:
             # Extract title
-            title_element = container.find('h2', class_='a-size-mini')
-            if not title_element:
-                title_element = container.find('span', class_='a-text-normal')
+            title_element = _first(_PRODUCT_TITLE_XP, container)
+            if title_element is None:
+                title_element = _first(_PRODUCT_TITLE_ALT_XP, container)
             
-            title = self._extract_text(title_element) if title_element else "Unknown"
+            title = self._node_text(title_element) if title_element is not None else "Unknown"
             
             # Extract URL
             url = None
-            link_element = container.find('a', class_='a-link-normal')
-            if link_element and link_element.get('href'):
-                url = 'https://amazon.com' + link_element['href']
+            link_element = _first(_PRODUCT_LINK_XP, container)
+            if link_element is not None and link_element.get('href'):
+                url = 'https://amazon.com' + link_element.get('href')
             
             # Extract rating
             rating = None
-            rating_element = container.find('span', class_='a-icon-alt')
-            if rating_element:
-                rating_text = rating_element.get_text()
-                rating_match = re.search(r'(\d+\.?\d*)', rating_text)
+            rating_element = _first(_PRODUCT_RATING_XP, container)
+            if rating_element is not None:
+                rating_text = self._node_text(rating_element)
+                rating_match = _FLOAT_RE.search(rating_text)
                 if rating_match:
-                    rating = self._safe_float_convert(rating_match.group(1))
+                    rating = float(rating_match.group())
             
             # Extract price
             price = None
-            price_element = container.find('span', class_='a-price-whole')
-            if price_element:
-                price_text = self._extract_text(price_element)
+            price_element = _first(_PRODUCT_PRICE_XP, container)
+            if price_element is not None:
+                price_text = self._node_text(price_element)
                 price = self._safe_float_convert(price_text)
             
             return {
@@ -339,9 +518,9 @@ class AmazonScraper(BaseScraper):
                 'url': url,
                 'rating': rating,
                 'price': price,
-                'platform': 'Amazon'
+                'platform': self.PLATFORM_NAME
             }
             
         except Exception as e:
-            logger.error(f"Error extracting product info: {e}")
+            logger.error("Error extracting product info: %s", e)
             return None 
\ No newline at end of file
@@ -2,21 +2,129 @@
 Base scraper class providing common functionality for all platform scrapers.
 """
 
+import os
+import re
+import math
 import time
 import random
+import asyncio
+import functools
+import threading
 import requests
-from typing import List, Dict, Optional
+from requests.adapters import HTTPAdapter
+from typing import Any, List, Dict, Optional, FrozenSet
 from abc import ABC, abstractmethod
+from bs4 import BeautifulSoup
 import logging
 from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
 from urllib.parse import urljoin, urlparse
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2 support)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Connections kept open at once by the async fetcher
+MAX_CONCURRENT_REQUESTS = 8
+
+# On-disk HTTP cache (SQLite via requests-cache) for repeated scraper runs
+HTTP_CACHE_NAME = 'feelnet_http_cache'
+HTTP_CACHE_EXPIRE_SECONDS = 3600
+
+# Exponential retry backoff: BACKOFF_BASE * 2**attempt seconds, capped
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 30.0
+
+# Characters stripped before numeric conversion
+_FLOAT_STRIP = re.compile(r'[^\d.]')
+_INT_STRIP = re.compile(r'\D')
+
+# Whitespace runs (including newlines) collapsed by _extract_text
+_WS_RE = re.compile(r'\s+')
+
 
-@dataclass
+def _build_shared_session() -> requests.Session:
+    """Create the keep-alive session pooled by every scraper in the process."""
+    if os.getenv('SCRAPER_HTTP_CACHE', 'false').lower() in ('1', 'true', 'yes'):
+        if REQUESTS_CACHE_AVAILABLE:
+            # Cache-Control/ETag from the server take precedence over the default expiry
+            session = requests_cache.CachedSession(
+                HTTP_CACHE_NAME,
+                backend='sqlite',
+                expire_after=HTTP_CACHE_EXPIRE_SECONDS,
+                allowable_codes=(200, 404),
+                cache_control=True
+            )
+        else:
+            logger.warning("SCRAPER_HTTP_CACHE is set but requests-cache is not installed")
+            session = requests.Session()
+    else:
+        session = requests.Session()
+    # One pool per host, each holding up to 100 idle connections; retries are
+    # handled by _make_request so the adapter itself does not retry
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=100, max_retries=0)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+_SHARED_SESSION = _build_shared_session()
+
+
+def _backoff_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """
+    Seconds to wait before retrying after a failed attempt.
+    
+    Args:
+        attempt: Zero-based number of the attempt that just failed
+        retry_after: Retry-After header value (delta-seconds or HTTP-date), if any
+        
+    Returns:
+        The server's requested delay, else capped exponential backoff with jitter
+    """
+    if retry_after:
+        retry_after = retry_after.strip()
+        if retry_after.isdigit():
+            return float(retry_after)
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError, IndexError, OverflowError):
+            pass
+    
+    return min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt) + random.random()
+
+
+@dataclass(frozen=True)
 class ReviewData:
     """Container for scraped review data."""
+    # Explicit __slots__ (slots=True needs Python 3.10) drops the per-instance
+    # __dict__ on large review lists; reviews are never mutated once scraped.
+    __slots__ = ('text', 'rating', 'author', 'date', 'title', 'helpful_votes',
+                 'verified', 'source_url', 'platform')
+    
     text: str
     rating: Optional[float]
     author: Optional[str]
@@ -26,6 +134,72 @@ class ReviewData:
     verified: bool
     source_url: str
     platform: str
+    
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state):
+        # The frozen __setattr__ would reject the default slot restore used
+        # by pickle and copy.deepcopy
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+    
+    Allows bursts of up to ``capacity`` requests at once while keeping the
+    long-run rate at ``refill_per_sec``. Callers reserve a token under the
+    lock and sleep outside it, so concurrent callers are spaced out instead
+    of serialized behind one another's sleeps.
+    """
+    
+    def __init__(self, capacity: int, refill_per_sec: float):
+        """
+        Initialize token bucket.
+        
+        Args:
+            capacity: Maximum tokens (requests that may start back to back)
+            refill_per_sec: Tokens added per second; <= 0 disables limiting
+        """
+        self.capacity = max(1, capacity)
+        self.refill_per_sec = refill_per_sec
+        self._tokens = float(self.capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """
+        Take one token, borrowing against future refills if the bucket is empty.
+        
+        Returns:
+            Seconds the caller must wait before using the token
+        """
+        if self.refill_per_sec <= 0:
+            return 0.0
+        
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity,
+                               self._tokens + (now - self._last_refill) * self.refill_per_sec)
+            self._last_refill = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.refill_per_sec
+    
+    def acquire(self):
+        """Block until a request may be sent."""
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+    
+    async def acquire_async(self):
+        """Wait, without blocking the event loop, until a request may be sent."""
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
 
 
 class BaseScraper(ABC):
@@ -36,34 +210,47 @@ class BaseScraper(ABC):
     and error handling.
     """
     
+    # Domains this scraper handles; a frozenset so validate_url is one hash probe
+    SUPPORTED_DOMAINS: FrozenSet[str] = frozenset()
+    
+    # Display name used for ReviewData.platform and get_platform_name
+    PLATFORM_NAME: str = ''
+    
     def __init__(self, 
                  rate_limit: float = 1.0,
                  timeout: int = 30,
                  retries: int = 3,
-                 user_agent: str = None):
+                 user_agent: str = None,
+                 burst: int = MAX_CONCURRENT_REQUESTS):
         """
         Initialize base scraper.
         
         Args:
-            rate_limit: Minimum time between requests (seconds)
+            rate_limit: Average time between requests (seconds)
             timeout: Request timeout (seconds)
             retries: Number of retry attempts
             user_agent: Custom user agent string
+            burst: Requests that may be in flight back to back before the
+                rate limit kicks in
         """
         self.rate_limit = rate_limit
         self.timeout = timeout
         self.retries = retries
-        self.last_request_time = 0
+        self._bucket = TokenBucket(burst, 1.0 / rate_limit if rate_limit > 0 else 0.0)
         
-        # Setup session with headers
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Per-scraper headers, sent with each request over the shared session
+        self.headers = {
             'User-Agent': user_agent or self._get_default_user_agent(),
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Accept-Encoding': 'gzip, deflate',
             'Connection': 'keep-alive',
-        })
+        }
+    
+    @property
+    def session(self) -> requests.Session:
+        """Process-wide session, so all scrapers reuse pooled keep-alive connections."""
+        return _SHARED_SESSION
     
     def _get_default_user_agent(self) -> str:
         """Get default user agent string."""
@@ -71,6 +258,13 @@ class BaseScraper(ABC):
                 'AppleWebKit/537.36 (KHTML, like Gecko) '
                 'Chrome/91.0.4472.124 Safari/537.36')
     
+    @classmethod
+    def clear_cache(cls):
+        """Drop every response stored in the on-disk HTTP cache, if enabled."""
+        cache = getattr(_SHARED_SESSION, 'cache', None)
+        if cache is not None:
+            cache.clear()
+    
     def _make_request(self, url: str, **kwargs) -> Optional[requests.Response]:
         """
         Make HTTP request with rate limiting and error handling.
@@ -85,41 +279,192 @@ class BaseScraper(ABC):
         # Apply rate limiting
         self._apply_rate_limit()
         
+        headers = {**self.headers, **(kwargs.pop('headers', None) or {})}
+        
+        waited = 0.0
         for attempt in range(self.retries):
+            retry_after = None
             try:
                 response = self.session.get(
                     url, 
+                    headers=headers,
                     timeout=self.timeout,
                     **kwargs
                 )
                 
                 if response.status_code == 200:
+                    # Pin the charset so response.text never falls back to
+                    # chardet sniffing of the whole body
+                    response.encoding = response.encoding or 'utf-8'
                     return response
                 elif response.status_code == 429:  # Rate limited
-                    logger.warning(f"Rate limited. Waiting before retry...")
-                    time.sleep(random.uniform(5, 10))
-                    continue
+                    logger.warning("Rate limited. Waiting before retry...")
+                    retry_after = response.headers.get('Retry-After')
                 else:
-                    logger.warning(f"HTTP {response.status_code} for {url}")
+                    logger.warning("HTTP %s for %s", response.status_code, url)
+                    continue
                     
             except requests.RequestException as e:
-                logger.error(f"Request error (attempt {attempt + 1}): {e}")
-                if attempt < self.retries - 1:
-                    time.sleep(random.uniform(1, 3))
+                logger.error("Request error (attempt %s): %s", attempt + 1, e)
+            
+            delay = self._retry_delay(attempt, waited, retry_after)
+            if delay is None:
+                break
+            time.sleep(delay)
+            waited += delay
+        
+        return None
+    
+    def _retry_delay(self, attempt: int, waited: float,
+                     retry_after: Optional[str] = None) -> Optional[float]:
+        """
+        Backoff before the next attempt, bounded by the request's wait budget.
+        
+        Total sleeping per request is capped at timeout * retries seconds.
+        
+        Args:
+            attempt: Zero-based number of the attempt that just failed
+            waited: Seconds already spent sleeping for this request
+            retry_after: Retry-After header value from a 429 response
+            
+        Returns:
+            Seconds to sleep, or None when no retry should be made
+        """
+        remaining = self.timeout * self.retries - waited
+        if attempt >= self.retries - 1 or remaining <= 0:
+            return None
+        return min(_backoff_delay(attempt, retry_after), remaining)
+    
+    def _get_text(self, response: requests.Response) -> str:
+        """
+        Decode a response body once and cache the text on the response.
+        
+        Args:
+            response: Response returned by _make_request
+            
+        Returns:
+            Decoded body text
+        """
+        text = getattr(response, '_cached_text', None)
+        if text is None:
+            text = response.content.decode(response.encoding or 'utf-8', errors='replace')
+            response._cached_text = text
+        return text
+    
+    def _get_json(self, url: str, **kwargs) -> Optional[Any]:
+        """
+        Fetch a URL and parse its body as JSON.
+        
+        Parses the raw bytes with orjson when available, skipping the
+        text decoding that response.json() performs first.
+        
+        Args:
+            url: URL to request
+            **kwargs: Additional arguments for requests
+            
+        Returns:
+            Parsed JSON value or None if the request or parsing failed
+        """
+        response = self._make_request(url, **kwargs)
+        if response is None:
+            return None
+        
+        try:
+            return _json_loads(response.content)
+        except ValueError as e:
+            logger.warning("Invalid JSON from %s: %s", url, e)
+            return None
+    
+    def _async_client(self) -> "httpx.AsyncClient":
+        """
+        Create an async HTTP client sharing this scraper's headers and timeout.
+        
+        Returns:
+            httpx.AsyncClient (HTTP/2 when h2 is installed)
+        """
+        return httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=MAX_CONCURRENT_REQUESTS),
+            headers=self.headers,
+            timeout=self.timeout,
+            follow_redirects=True,
+        )
+    
+    async def _make_request_async(self, client: "httpx.AsyncClient", url: str) -> Optional[bytes]:
+        """
+        Async counterpart of _make_request with the same retry policy.
+        
+        Args:
+            client: Client from _async_client
+            url: URL to request
+            
+        Returns:
+            Response body or None if failed
+        """
+        await self._bucket.acquire_async()
+        
+        waited = 0.0
+        for attempt in range(self.retries):
+            retry_after = None
+            try:
+                response = await client.get(url)
+                
+                if response.status_code == 200:
+                    return response.content
+                elif response.status_code == 429:  # Rate limited
+                    logger.warning("Rate limited. Waiting before retry...")
+                    retry_after = response.headers.get('Retry-After')
+                else:
+                    logger.warning("HTTP %s for %s", response.status_code, url)
                     continue
+                    
+            except httpx.HTTPError as e:
+                logger.error("Request error (attempt %s): %s", attempt + 1, e)
+            
+            delay = self._retry_delay(attempt, waited, retry_after)
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+            waited += delay
         
         return None
     
-    def _apply_rate_limit(self):
-        """Apply rate limiting between requests."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+    async def _fetch_pages_async(self, urls: List[str]) -> List[Optional[bytes]]:
+        """
+        Fetch several URLs concurrently over one pooled client.
         
-        if time_since_last < self.rate_limit:
-            sleep_time = self.rate_limit - time_since_last
-            time.sleep(sleep_time)
+        Args:
+            urls: URLs to request
+            
+        Returns:
+            Response bodies aligned with urls (None for failed requests)
+        """
+        async with self._async_client() as client:
+            return await asyncio.gather(
+                *(self._make_request_async(client, url) for url in urls)
+            )
+    
+    async def scrape_reviews_async(self, url: str, max_reviews: int = 100) -> List[ReviewData]:
+        """
+        Awaitable scrape_reviews, so callers can gather several products at once.
         
-        self.last_request_time = time.time()
+        The default runs scrape_reviews on the event loop's thread pool.
+        
+        Args:
+            url: URL to scrape reviews from
+            max_reviews: Maximum number of reviews to scrape
+            
+        Returns:
+            List of ReviewData objects
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.scrape_reviews, url, max_reviews)
+        )
+    
+    def _apply_rate_limit(self):
+        """Apply rate limiting between requests."""
+        self._bucket.acquire()
     
     @abstractmethod
     def scrape_reviews(self, url: str, max_reviews: int = 100) -> List[ReviewData]:
@@ -159,25 +504,43 @@ class BaseScraper(ABC):
         Returns:
             True if URL is valid for this platform
         """
+        # Subclasses that only override get_supported_domains still validate
+        domains = self.SUPPORTED_DOMAINS or frozenset(self.get_supported_domains())
         try:
             parsed = urlparse(url)
-            return parsed.netloc.lower() in self.get_supported_domains()
+            return parsed.netloc.lower() in domains
         except:
             return False
     
-    @abstractmethod
-    def get_supported_domains(self) -> List[str]:
+    @classmethod
+    def get_supported_domains(cls) -> List[str]:
         """
         Get list of supported domain names for this scraper.
         
+        Domains are static per scraper class, so no instance is needed.
+        
         Returns:
-            List of domain names
+            Sorted list of domain names
         """
-        pass
+        return sorted(cls.SUPPORTED_DOMAINS)
     
-    def get_platform_name(self) -> str:
+    @classmethod
+    def get_platform_name(cls) -> str:
         """Get the platform name for this scraper."""
-        return self.__class__.__name__.replace('Scraper', '')
+        # Scrapers registered without PLATFORM_NAME fall back to the class name
+        return cls.PLATFORM_NAME or cls.__name__.replace('Scraper', '')
+    
+    def _parse_html(self, markup) -> BeautifulSoup:
+        """
+        Parse HTML with BeautifulSoup on the C-implemented lxml parser.
+        
+        Args:
+            markup: HTML as str or bytes (e.g. response.content)
+            
+        Returns:
+            BeautifulSoup document
+        """
+        return BeautifulSoup(markup, 'lxml')
     
     def _extract_text(self, element) -> str:
         """
@@ -192,11 +555,8 @@ class BaseScraper(ABC):
         if element is None:
             return ""
         
-        text = element.get_text(strip=True)
-        # Clean up common HTML entities and extra whitespace
-        text = text.replace('\n', ' ').replace('\r', ' ')
-        text = ' '.join(text.split())  # Normalize whitespace
-        return text
+        # Space-separate text from adjacent tags, then normalize whitespace in one pass
+        return _WS_RE.sub(' ', element.get_text(separator=' ', strip=True)).strip()
     
     def _safe_float_convert(self, value: str) -> Optional[float]:
         """
@@ -208,12 +568,18 @@ class BaseScraper(ABC):
         Returns:
             Float value or None if conversion fails
         """
+        # Native numbers (e.g. from JSON APIs) skip the regex entirely
+        if isinstance(value, (int, float)):
+            value = float(value)
+            return None if math.isnan(value) else value
         if not value:
             return None
         
         try:
+            if isinstance(value, bytes):
+                value = value.decode('ascii', errors='ignore')
             # Remove common non-numeric characters
-            cleaned = ''.join(c for c in str(value) if c.isdigit() or c == '.')
+            cleaned = _FLOAT_STRIP.sub('', value if isinstance(value, str) else str(value))
             return float(cleaned) if cleaned else None
         except (ValueError, TypeError):
             return None
@@ -228,12 +594,20 @@ class BaseScraper(ABC):
         Returns:
             Integer value or None if conversion fails
         """
+        # Native numbers (e.g. from JSON APIs) skip the regex entirely
+        if isinstance(value, (int, float)):
+            try:
+                return int(value)
+            except (ValueError, OverflowError):  # NaN / infinity
+                return None
         if not value:
             return None
         
         try:
+            if isinstance(value, bytes):
+                value = value.decode('ascii', errors='ignore')
             # Remove common non-numeric characters
-            cleaned = ''.join(c for c in str(value) if c.isdigit())
+            cleaned = _INT_STRIP.sub('', value if isinstance(value, str) else str(value))
             return int(cleaned) if cleaned else None
         except (ValueError, TypeError):
             return None 
\ No newline at end of file
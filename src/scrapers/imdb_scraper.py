@@ -17,9 +17,9 @@ class IMDbScraper(BaseScraper):
     Note: This is a basic implementation. IMDb has anti-scraping measures.
     """
     
-    def get_supported_domains(self) -> List[str]:
-        """Get supported IMDb domains."""
-        return ['imdb.com']
+    PLATFORM_NAME = 'IMDb'
+    
+    SUPPORTED_DOMAINS = frozenset({'imdb.com'})
     
     def scrape_reviews(self, url: str, max_reviews: int = 100) -> List[ReviewData]:
         """
@@ -33,7 +33,7 @@ class IMDbScraper(BaseScraper):
             List of ReviewData objects
         """
         # Placeholder implementation
-        logger.info(f"IMDb scraper not fully implemented yet. URL: {url}")
+        logger.info("IMDb scraper not fully implemented yet. URL: %s", url)
         
         # Return sample data for demonstration
         return [
@@ -46,7 +46,7 @@ class IMDbScraper(BaseScraper):
                 helpful_votes=5,
                 verified=False,
                 source_url=url,
-                platform='IMDb'
+                platform=self.PLATFORM_NAME
             )
         ]
     
@@ -62,7 +62,7 @@ class IMDbScraper(BaseScraper):
             List of movie/show information dictionaries
         """
         # Placeholder implementation
-        logger.info(f"IMDb search not fully implemented yet. Query: {query}")
+        logger.info("IMDb search not fully implemented yet. Query: %s", query)
         
         return [
             {
@@ -70,6 +70,6 @@ class IMDbScraper(BaseScraper):
                 'url': 'https://imdb.com/title/tt0000000',
                 'rating': 7.5,
                 'year': 2024,
-                'platform': 'IMDb'
+                'platform': self.PLATFORM_NAME
             }
         ] 
\ No newline at end of file
@@ -2,17 +2,24 @@
 Factory class for creating appropriate scrapers based on platform or URL.
 """
 
-from typing import Dict, Type, Optional
+from typing import Dict, Type, Optional, Union
 from urllib.parse import urlparse
+import functools
+import importlib
 import logging
 
 from .base_scraper import BaseScraper
-from .amazon_scraper import AmazonScraper
-from .imdb_scraper import IMDbScraper
-from .tripadvisor_scraper import TripAdvisorScraper
 
 logger = logging.getLogger(__name__)
 
+# Built-in scrapers as "module:Class" paths; each module (and its parser or
+# browser dependencies) is imported only when that scraper is first needed
+BUILTIN_SCRAPERS = {
+    'amazon': '.amazon_scraper:AmazonScraper',
+    'imdb': '.imdb_scraper:IMDbScraper',
+    'tripadvisor': '.tripadvisor_scraper:TripAdvisorScraper',
+}
+
 
 class ScraperFactory:
     """
@@ -24,29 +31,82 @@ class ScraperFactory:
     
     def __init__(self):
         """Initialize scraper factory with available scrapers."""
-        self._scrapers: Dict[str, Type[BaseScraper]] = {
-            'amazon': AmazonScraper,
-            'imdb': IMDbScraper,
-            'tripadvisor': TripAdvisorScraper
-        }
+        # Platform -> scraper class, or its import path until first resolved
+        self._scrapers: Dict[str, Union[str, Type[BaseScraper]]] = dict(BUILTIN_SCRAPERS)
+        
+        # Domain to scraper mapping, built on the first URL lookup
+        self._domain_mapping: Optional[Dict[str, Type[BaseScraper]]] = None
+        
+        # Memoized host lookups and introspection results, cleared whenever
+        # the registry changes
+        self._scraper_class_for_host = functools.lru_cache(maxsize=1024)(self._lookup_scraper_class)
+        self._supported_platforms = functools.lru_cache(maxsize=1)(self._build_supported_platforms)
+        self._scraper_info = functools.lru_cache(maxsize=1)(self._build_scraper_info)
+    
+    def _resolve(self, platform: str) -> Optional[Type[BaseScraper]]:
+        """
+        Get the scraper class for a platform, importing it on first use.
+        
+        Args:
+            platform: Lowercase platform name
+            
+        Returns:
+            Scraper class or None if it could not be imported
+        """
+        entry = self._scrapers[platform]
+        if not isinstance(entry, str):
+            return entry
+        
+        module_name, class_name = entry.split(':')
+        try:
+            scraper_class = getattr(importlib.import_module(module_name, __package__), class_name)
+        except Exception as e:
+            logger.warning("Error loading %s scraper: %s", platform, e)
+            return None
         
-        # Domain to scraper mapping
-        self._domain_mapping = {}
-        self._build_domain_mapping()
+        self._scrapers[platform] = scraper_class
+        return scraper_class
     
-    def _build_domain_mapping(self):
+    def _get_domain_mapping(self) -> Dict[str, Type[BaseScraper]]:
+        """Get the domain to scraper mapping, building it on first use."""
+        if self._domain_mapping is None:
+            # Published only once complete, so concurrent lookups never see a partial map
+            self._domain_mapping = self._build_domain_mapping()
+        return self._domain_mapping
+    
+    def _build_domain_mapping(self) -> Dict[str, Type[BaseScraper]]:
         """Build mapping from domains to scrapers."""
-        for platform, scraper_class in self._scrapers.items():
+        domain_mapping = {}
+        for platform in list(self._scrapers):
+            scraper_class = self._resolve(platform)
+            if scraper_class is None:
+                continue
+            
             try:
-                # Create temporary instance to get supported domains
-                temp_scraper = scraper_class()
-                domains = temp_scraper.get_supported_domains()
+                domains = scraper_class.get_supported_domains()
                 
-                for domain in domains:
-                    self._domain_mapping[domain.lower()] = scraper_class
+                self._add_domains(domain_mapping, domains, scraper_class)
                     
             except Exception as e:
-                logger.warning(f"Error setting up {platform} scraper: {e}")
+                logger.warning("Error setting up %s scraper: %s", platform, e)
+        
+        return domain_mapping
+    
+    @staticmethod
+    def _add_domains(domain_mapping: Dict[str, Type[BaseScraper]], domains, scraper_class: Type[BaseScraper]):
+        """
+        Map each domain, and its www. alias, to a scraper class.
+        
+        Args:
+            domain_mapping: Mapping to update
+            domains: Domain names handled by the scraper
+            scraper_class: Scraper class for those domains
+        """
+        for domain in domains:
+            domain = domain.lower()
+            domain_mapping[domain] = scraper_class
+            # www. hosts then resolve on the first probe without stripping the prefix
+            domain_mapping[f"www.{domain}"] = scraper_class
     
     def get_scraper_by_url(self, url: str, **kwargs) -> Optional[BaseScraper]:
         """
@@ -60,30 +120,47 @@ class ScraperFactory:
             Appropriate scraper instance or None if not supported
         """
         try:
-            parsed_url = urlparse(url)
-            domain = parsed_url.netloc.lower()
+            # hostname drops any port and credentials and is already lowercase
+            host = urlparse(url).hostname or ''
+            scraper_class = self._scraper_class_for_host(host)
             
-            # Remove 'www.' prefix if present
-            if domain.startswith('www.'):
-                domain = domain[4:]
-            
-            # Check direct domain match
-            if domain in self._domain_mapping:
-                scraper_class = self._domain_mapping[domain]
+            if scraper_class is not None:
                 return scraper_class(**kwargs)
             
-            # Check if domain contains any supported domain
-            for supported_domain, scraper_class in self._domain_mapping.items():
-                if supported_domain in domain:
-                    return scraper_class(**kwargs)
-            
-            logger.warning(f"No scraper found for domain: {domain}")
+            logger.warning("No scraper found for domain: %s", host)
             return None
             
         except Exception as e:
-            logger.error(f"Error determining scraper for URL {url}: {e}")
+            logger.error("Error determining scraper for URL %s: %s", url, e)
             return None
     
+    def _lookup_scraper_class(self, host: str) -> Optional[Type[BaseScraper]]:
+        """
+        Resolve the scraper class for a lowercase host name.
+        
+        Args:
+            host: Lowercase host name of a URL (no port)
+            
+        Returns:
+            Matching scraper class or None if not supported
+        """
+        domain_mapping = self._get_domain_mapping()
+        
+        # Exact hosts, including www. aliases, need a single probe
+        scraper_class = domain_mapping.get(host)
+        if scraper_class is not None:
+            return scraper_class
+        
+        # Probe each parent domain (amazon.co.uk, co.uk for smile.amazon.co.uk):
+        # one dict lookup per label instead of a scan over every domain
+        parts = host.split('.')
+        for i in range(1, len(parts) - 1):
+            scraper_class = domain_mapping.get('.'.join(parts[i:]))
+            if scraper_class is not None:
+                return scraper_class
+        
+        return None
+    
     def get_scraper_by_platform(self, platform: str, **kwargs) -> Optional[BaseScraper]:
         """
         Get scraper for specific platform.
@@ -98,27 +175,33 @@ class ScraperFactory:
         platform_lower = platform.lower()
         
         if platform_lower in self._scrapers:
-            scraper_class = self._scrapers[platform_lower]
-            return scraper_class(**kwargs)
+            scraper_class = self._resolve(platform_lower)
+            return scraper_class(**kwargs) if scraper_class is not None else None
         
-        logger.warning(f"Platform '{platform}' not supported")
+        logger.warning("Platform '%s' not supported", platform)
         return None
     
     def get_supported_platforms(self) -> Dict[str, list]:
         """
         Get list of supported platforms and their domains.
         
+        The result is built once per registry state and shared; treat it as read-only.
+        
         Returns:
             Dictionary mapping platform names to supported domains
         """
+        return self._supported_platforms()
+    
+    def _build_supported_platforms(self) -> Dict[str, list]:
+        """Build the platform -> domains mapping returned by get_supported_platforms."""
         result = {}
         
-        for platform, scraper_class in self._scrapers.items():
+        for platform in list(self._scrapers):
             try:
-                temp_scraper = scraper_class()
-                result[platform] = temp_scraper.get_supported_domains()
+                scraper_class = self._resolve(platform)
+                result[platform] = scraper_class.get_supported_domains() if scraper_class else []
             except Exception as e:
-                logger.warning(f"Error getting domains for {platform}: {e}")
+                logger.warning("Error getting domains for %s: %s", platform, e)
                 result[platform] = []
         
         return result
@@ -133,8 +216,11 @@ class ScraperFactory:
         Returns:
             True if URL is supported
         """
-        scraper = self.get_scraper_by_url(url)
-        return scraper is not None
+        # Class lookup only: validating a URL should not construct a scraper
+        try:
+            return self._scraper_class_for_host(urlparse(url).hostname or '') is not None
+        except ValueError:  # malformed URL, e.g. an invalid IPv6 host
+            return False
     
     def register_scraper(self, platform: str, scraper_class: Type[BaseScraper]):
         """
@@ -149,43 +235,61 @@ class ScraperFactory:
         
         self._scrapers[platform.lower()] = scraper_class
         
-        # Update domain mapping
-        try:
-            temp_scraper = scraper_class()
-            domains = temp_scraper.get_supported_domains()
-            
-            for domain in domains:
-                self._domain_mapping[domain.lower()] = scraper_class
+        # Update domain mapping (a mapping not built yet will pick the scraper up)
+        if self._domain_mapping is not None:
+            try:
+                domains = scraper_class.get_supported_domains()
                 
-        except Exception as e:
-            logger.warning(f"Error registering scraper for {platform}: {e}")
+                self._add_domains(self._domain_mapping, domains, scraper_class)
+                    
+            except Exception as e:
+                logger.warning("Error registering scraper for %s: %s", platform, e)
         
-        logger.info(f"Registered scraper for platform: {platform}")
+        self._scraper_class_for_host.cache_clear()
+        self._supported_platforms.cache_clear()
+        self._scraper_info.cache_clear()
+        
+        logger.info("Registered scraper for platform: %s", platform)
     
     def get_scraper_info(self) -> Dict:
         """
         Get information about all available scrapers.
         
+        The result is built once per registry state and shared; treat it as read-only.
+        
         Returns:
             Dictionary with scraper information
         """
+        return self._scraper_info()
+    
+    def _build_scraper_info(self) -> Dict:
+        """Build the summary returned by get_scraper_info."""
         info = {
             'total_scrapers': len(self._scrapers),
             'platforms': list(self._scrapers.keys()),
-            'supported_domains': list(self._domain_mapping.keys()),
+            'supported_domains': [
+                domain for domain in self._get_domain_mapping() if not domain.startswith('www.')
+            ],
             'platform_details': {}
         }
         
-        for platform, scraper_class in self._scrapers.items():
+        for platform in list(self._scrapers):
+            scraper_class = self._resolve(platform)
+            if scraper_class is None:
+                info['platform_details'][platform] = {
+                    'class_name': self._scrapers[platform].split(':')[1],
+                    'error': 'scraper could not be imported'
+                }
+                continue
+            
             try:
-                temp_scraper = scraper_class()
                 info['platform_details'][platform] = {
                     'class_name': scraper_class.__name__,
-                    'supported_domains': temp_scraper.get_supported_domains(),
-                    'platform_name': temp_scraper.get_platform_name()
+                    'supported_domains': scraper_class.get_supported_domains(),
+                    'platform_name': scraper_class.get_platform_name()
                 }
             except Exception as e:
-                logger.warning(f"Error getting info for {platform}: {e}")
+                logger.warning("Error getting info for %s: %s", platform, e)
                 info['platform_details'][platform] = {
                     'class_name': scraper_class.__name__,
                     'error': str(e)
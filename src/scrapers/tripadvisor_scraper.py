@@ -17,17 +17,17 @@ class TripAdvisorScraper(BaseScraper):
     Note: This is a basic implementation. TripAdvisor has anti-scraping measures.
     """
     
-    def get_supported_domains(self) -> List[str]:
-        """Get supported TripAdvisor domains."""
-        return [
-            'tripadvisor.com',
-            'tripadvisor.co.uk',
-            'tripadvisor.ca',
-            'tripadvisor.de',
-            'tripadvisor.fr',
-            'tripadvisor.it',
-            'tripadvisor.es'
-        ]
+    PLATFORM_NAME = 'TripAdvisor'
+    
+    SUPPORTED_DOMAINS = frozenset({
+        'tripadvisor.com',
+        'tripadvisor.co.uk',
+        'tripadvisor.ca',
+        'tripadvisor.de',
+        'tripadvisor.fr',
+        'tripadvisor.it',
+        'tripadvisor.es'
+    })
     
     def scrape_reviews(self, url: str, max_reviews: int = 100) -> List[ReviewData]:
         """
@@ -41,7 +41,7 @@ class TripAdvisorScraper(BaseScraper):
             List of ReviewData objects
         """
         # Placeholder implementation
-        logger.info(f"TripAdvisor scraper not fully implemented yet. URL: {url}")
+        logger.info("TripAdvisor scraper not fully implemented yet. URL: %s", url)
         
         # Return sample data for demonstration
         return [
@@ -54,7 +54,7 @@ class TripAdvisorScraper(BaseScraper):
                 helpful_votes=3,
                 verified=True,
                 source_url=url,
-                platform='TripAdvisor'
+                platform=self.PLATFORM_NAME
             ),
             ReviewData(
                 text="Another sample review. The service was excellent and the location was perfect.",
@@ -65,7 +65,7 @@ class TripAdvisorScraper(BaseScraper):
                 helpful_votes=7,
                 verified=True,
                 source_url=url,
-                platform='TripAdvisor'
+                platform=self.PLATFORM_NAME
             )
         ]
     
@@ -81,7 +81,7 @@ class TripAdvisorScraper(BaseScraper):
             List of hotel/restaurant information dictionaries
         """
         # Placeholder implementation
-        logger.info(f"TripAdvisor search not fully implemented yet. Query: {query}")
+        logger.info("TripAdvisor search not fully implemented yet. Query: %s", query)
         
         return [
             {
@@ -89,6 +89,6 @@ class TripAdvisorScraper(BaseScraper):
                 'url': 'https://tripadvisor.com/Hotel_Review-sample',
                 'rating': 4.2,
                 'location': 'Sample City',
-                'platform': 'TripAdvisor'
+                'platform': self.PLATFORM_NAME
             }
         ] 
\ No newline at end of file
@@ -4,4 +4,4 @@ Utility functions and helpers for feelnet.
 
 from .helpers import *
 
-__all__ = ["format_confidence", "get_sentiment_color", "validate_text_input"] 
\ No newline at end of file
+__all__ = ["SENTIMENT_COLORS", "format_confidence", "get_sentiment_color", "validate_text_input", "validate_text_inputs"] 
\ No newline at end of file
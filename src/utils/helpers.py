@@ -3,7 +3,8 @@ Helper utility functions for feelnet.
 """
 
 import re
-from typing import Dict, Any, Optional
+import numpy as np
+from typing import Dict, Any, List, Optional, Tuple
 
 
 def format_confidence(confidence: float) -> str:
@@ -11,14 +12,16 @@ def format_confidence(confidence: float) -> str:
     return f"{confidence * 100:.1f}%"
 
 
+SENTIMENT_COLORS = {
+    'positive': '#27ae60',  # Green
+    'negative': '#e74c3c',  # Red
+    'neutral': '#f39c12'    # Orange
+}
+
+
 def get_sentiment_color(sentiment: str) -> str:
     """Get color code for sentiment visualization."""
-    colors = {
-        'positive': '#27ae60',  # Green
-        'negative': '#e74c3c',  # Red
-        'neutral': '#f39c12'    # Orange
-    }
-    return colors.get(sentiment.lower(), '#6c757d')
+    return SENTIMENT_COLORS.get(sentiment.lower(), '#6c757d')
 
 
 def validate_text_input(text: str, max_length: int = 10000) -> Dict[str, Any]:
@@ -32,4 +35,15 @@ def validate_text_input(text: str, max_length: int = 10000) -> Dict[str, Any]:
     if len(text) > max_length:
         return {'valid': False, 'error': f'Text too long. Max {max_length} chars'}
     
-    return {'valid': True, 'cleaned_text': text, 'length': len(text)} 
\ No newline at end of file
+    return {'valid': True, 'cleaned_text': text, 'length': len(text)} 
+
+
+def validate_text_inputs(texts: List[str], max_length: int = 10000) -> Tuple[np.ndarray, np.ndarray]:
+    """Validate many texts at once; returns (valid mask, stripped lengths, -1 for non-str)."""
+    lengths = np.fromiter(
+        (len(text.strip()) if isinstance(text, str) else -1 for text in texts),
+        dtype=np.int64,
+        count=len(texts)
+    )
+    valid = (lengths > 0) & (lengths <= max_length)
+    return valid, lengths
@@ -7,6 +7,7 @@ Quick test to verify that feelnet is properly installed and working.
 
 import sys
 import os
+from importlib.metadata import distribution, PackageNotFoundError
 
 def test_imports():
     """Test if all required modules can be imported."""
@@ -34,24 +35,26 @@ def test_dependencies():
     """Test if all required dependencies are available."""
     print("\n🔍 Testing dependencies...")
     
+    # Distribution names; metadata lookups avoid importing heavy packages
     dependencies = [
-        ('pandas', 'pandas'),
-        ('numpy', 'numpy'), 
-        ('sklearn', 'scikit-learn'),
-        ('vaderSentiment', 'vaderSentiment'),
-        ('textblob', 'textblob'),
-        ('requests', 'requests'),
-        ('bs4', 'beautifulsoup4'),
-        ('flask', 'flask')
+        'pandas',
+        'numpy',
+        'scikit-learn',
+        'vaderSentiment',
+        'textblob',
+        'requests',
+        'beautifulsoup4',
+        'lxml',
+        'flask'
     ]
     
     missing = []
     
-    for module, package in dependencies:
+    for package in dependencies:
         try:
-            __import__(module)
+            distribution(package)
             print(f"✅ {package}")
-        except ImportError:
+        except PackageNotFoundError:
             print(f"❌ {package} - Missing")
             missing.append(package)
     
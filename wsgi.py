@@ -0,0 +1,15 @@
+"""
+WSGI entry point for running feelnet under a production server.
+
+Example:
+    gunicorn wsgi:app
+
+Do not use --preload: each worker should import the app itself so that
+models, database connections and background threads are created after fork.
+"""
+
+from app import app, init_database
+
+init_database()
+
+__all__ = ["app"]